@@ -29,8 +29,9 @@ class MockBackend:
     Useful for testing the full pipeline without a running ComfyUI instance.
     """
 
-    def __init__(self, output_dir: Path | None = None) -> None:
+    def __init__(self, output_dir: Path | None = None, step_delay: float = 0.05) -> None:
         self.output_dir = output_dir or Path.home() / ".animeforge" / "mock_output"
+        self.step_delay = step_delay
 
     async def connect(self) -> None:
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -50,7 +51,7 @@ class MockBackend:
         for step in range(total_steps):
             if progress_callback:
                 progress_callback(step + 1, total_steps, f"Mock generating step {step + 1}")
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(self.step_delay)
 
         seed = request.seed if request.seed >= 0 else _prompt_seed(request.prompt)
         img = _create_gradient_image(
@@ -5,12 +5,14 @@ from __future__ import annotations
 from pathlib import Path
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AnimationDef(BaseModel):
     """Definition for a character animation state."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     name: str
     zone_id: str
@@ -24,6 +26,8 @@ class AnimationDef(BaseModel):
 class StateTransition(BaseModel):
     """Transition between two animation states."""
 
+    model_config = ConfigDict(defer_build=True)
+
     from_state: str
     to_state: str
     duration_ms: int = 500
@@ -33,6 +37,8 @@ class StateTransition(BaseModel):
 class Character(BaseModel):
     """A character that can be placed in a scene with animations."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID = Field(default_factory=uuid4)
     name: str
     description: str
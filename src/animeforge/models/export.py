@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from animeforge.models.enums import Season, TimeOfDay, Weather
 
@@ -13,6 +13,8 @@ from animeforge.models.enums import Season, TimeOfDay, Weather
 class ExportConfig(BaseModel):
     """Configuration for exporting a scene to a web package."""
 
+    model_config = ConfigDict(defer_build=True)
+
     output_dir: Path = Path("output")
     image_quality: int = Field(default=85, ge=1, le=100)
     image_format: str = "webp"
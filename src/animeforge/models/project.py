@@ -6,7 +6,7 @@ import json
 from pathlib import Path
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic import ValidationError as PydanticValidationError
 
 from animeforge.models.character import Character
@@ -20,6 +20,8 @@ class ProjectLoadError(ValueError):
 class Project(BaseModel):
     """A complete AnimeForge project with scene, character, and metadata."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID = Field(default_factory=uuid4)
     name: str
     version: str = "0.1.0"
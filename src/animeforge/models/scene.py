@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from pathlib import Path
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from animeforge.models.enums import EffectType, Season, TimeOfDay, Weather
 
@@ -13,6 +14,8 @@ from animeforge.models.enums import EffectType, Season, TimeOfDay, Weather
 class Rect(BaseModel):
     """Rectangle in scene coordinates."""
 
+    model_config = ConfigDict(defer_build=True)
+
     x: float
     y: float
     width: float
@@ -22,6 +25,8 @@ class Rect(BaseModel):
 class Layer(BaseModel):
     """A compositable layer in the scene (background, midground, foreground)."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     z_index: int
     image_path: Path | None = None
@@ -34,6 +39,8 @@ class Layer(BaseModel):
 class Zone(BaseModel):
     """An interactive zone within the scene where animations can play."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     name: str
     bounds: Rect
@@ -46,6 +53,8 @@ class Zone(BaseModel):
 class EffectDef(BaseModel):
     """Definition for a visual effect (particles, overlays, ambient)."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     type: EffectType
     weather_trigger: Weather | None = None
@@ -57,6 +66,8 @@ class EffectDef(BaseModel):
 class Scene(BaseModel):
     """Complete scene definition with layers, zones, and effects."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID = Field(default_factory=uuid4)
     name: str
     description: str = ""
@@ -68,3 +79,11 @@ class Scene(BaseModel):
     default_time: TimeOfDay = TimeOfDay.DAY
     default_weather: Weather = Weather.CLEAR
     default_season: Season = Season.SUMMER
+
+    @property
+    def base_layer(self) -> Layer | None:
+        """The background layer (lowest ``z_index``), or ``None`` if there are no layers."""
+        layers = self.layers
+        if len(layers) <= 1:
+            return layers[0] if layers else None
+        return min(layers, key=attrgetter("z_index"))
@@ -30,6 +30,10 @@ class ExportError(Exception):
 RUNTIME_JS_FILENAME = "animeforge-runtime.js"
 SCENE_LOADER_JS_FILENAME = "scene-loader.js"
 
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+_RUNTIME_DIR = _PACKAGE_DIR / "runtime"
+_TEMPLATE_DIR = _PACKAGE_DIR / "templates"
+
 
 # ---------------------------------------------------------------------------
 # Dry-run validation
@@ -172,26 +176,21 @@ def validate_export(
             )
 
     # 5. Runtime JS available
-    runtime_dir = Path(__file__).resolve().parent.parent / "runtime"
-    runtime_js = runtime_dir / RUNTIME_JS_FILENAME
-    loader_js = runtime_dir / SCENE_LOADER_JS_FILENAME
-    js_ok = runtime_js.exists() and loader_js.exists()
-    missing_js: list[str] = []
-    if not runtime_js.exists():
-        missing_js.append(RUNTIME_JS_FILENAME)
-    if not loader_js.exists():
-        missing_js.append(SCENE_LOADER_JS_FILENAME)
+    missing_js = [
+        name
+        for name in (RUNTIME_JS_FILENAME, SCENE_LOADER_JS_FILENAME)
+        if not (_RUNTIME_DIR / name).exists()
+    ]
     checks.append(
         DryRunCheck(
             label="Runtime JS available",
-            passed=js_ok,
+            passed=not missing_js,
             message=f"Missing: {', '.join(missing_js)}" if missing_js else "",
         )
     )
 
     # 6. Templates available
-    template_dir = Path(__file__).resolve().parent.parent / "templates"
-    template_ok = (template_dir / "index.html.jinja2").exists()
+    template_ok = (_TEMPLATE_DIR / "index.html.jinja2").exists()
     checks.append(
         DryRunCheck(
             label="Templates available",
@@ -541,9 +540,7 @@ def export_project(
     # ------------------------------------------------------------------
     # 5. Copy runtime JS
     # ------------------------------------------------------------------
-    runtime_dir = Path(__file__).resolve().parent.parent / "runtime"
-
-    runtime_src = runtime_dir / RUNTIME_JS_FILENAME
+    runtime_src = _RUNTIME_DIR / RUNTIME_JS_FILENAME
     runtime_dest = out / RUNTIME_JS_FILENAME
     if runtime_src.exists():
         shutil.copy2(runtime_src, runtime_dest)
@@ -554,7 +551,7 @@ def export_project(
             runtime_src,
         )
 
-    loader_src = runtime_dir / SCENE_LOADER_JS_FILENAME
+    loader_src = _RUNTIME_DIR / SCENE_LOADER_JS_FILENAME
     loader_dest = out / SCENE_LOADER_JS_FILENAME
     if loader_src.exists():
         shutil.copy2(loader_src, loader_dest)
@@ -61,9 +61,7 @@ async def generate_scene_backgrounds(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Locate the base background layer (lowest z_index layer).
-    base_layer = None
-    if scene.layers:
-        base_layer = min(scene.layers, key=lambda ly: ly.z_index)
+    base_layer = scene.base_layer
 
     results: dict[TimeOfDay, Path] = {}
 
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import jsonschema
+import jsonschema.exceptions
+import jsonschema.validators
 
 _SCHEMA_PATH = Path(__file__).resolve().parent.parent / "schemas" / "scene.schema.json"
 
 
+@lru_cache(maxsize=1)
+def _scene_validator() -> Any:
+    """Load scene.schema.json and build its validator once per process."""
+    schema = json.loads(_SCHEMA_PATH.read_text(encoding="utf-8"))
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 def validate_scene_json(data: dict[str, object]) -> None:
     """Validate scene data dict against scene.schema.json.
 
@@ -23,5 +36,7 @@ def validate_scene_json(data: dict[str, object]) -> None:
     jsonschema.ValidationError
         If the data does not conform to the schema.
     """
-    schema = json.loads(_SCHEMA_PATH.read_text(encoding="utf-8"))
-    jsonschema.validate(data, schema)
+    # Same error selection as jsonschema.validate(), minus the per-call schema load.
+    error = jsonschema.exceptions.best_match(_scene_validator().iter_errors(data))
+    if error is not None:
+        raise error
@@ -8,6 +8,7 @@ import http.server
 import json
 import threading
 import webbrowser
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +21,12 @@ from animeforge.backend.mock import MockBackend
 _TEMPLATE_PATH = Path(__file__).parent / "templates" / "preview.html"
 
 
+@lru_cache(maxsize=1)
+def _preview_html() -> bytes:
+    """Read and encode preview.html once per process."""
+    return _TEMPLATE_PATH.read_text(encoding="utf-8").encode()
+
+
 class _HTMLHandler(http.server.BaseHTTPRequestHandler):
     """Serves the preview HTML page."""
 
@@ -27,11 +34,12 @@ class _HTMLHandler(http.server.BaseHTTPRequestHandler):
 
     def do_GET(self) -> None:
         if self.path == "/" or self.path.startswith("/?"):
-            html = _TEMPLATE_PATH.read_text(encoding="utf-8")
+            html = _preview_html()
             self.send_response(200)
             self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(html)))
             self.end_headers()
-            self.wfile.write(html.encode())
+            self.wfile.write(html)
         else:
             self.send_error(404)
 
@@ -47,6 +55,7 @@ class PreviewServer:
         self.ws_port = ws_port
         self._clients: set[websockets.asyncio.server.ServerConnection] = set()
         self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._client_connected = asyncio.Event()
         self._http_server: http.server.HTTPServer | None = None
 
     async def broadcast(self, message: dict[str, Any]) -> None:
@@ -78,6 +87,7 @@ class PreviewServer:
     async def _ws_handler(self, websocket: websockets.asyncio.server.ServerConnection) -> None:
         """Handle a single WebSocket connection."""
         self._clients.add(websocket)
+        self._client_connected.set()
         try:
             async for _message in websocket:
                 pass  # we only send, never receive meaningful data
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
@@ -37,14 +39,37 @@ from animeforge.pipeline.scene_gen import generate_scene_backgrounds
 from animeforge.widgets import ProgressPanel
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from textual.app import ComposeResult
     from textual.binding import BindingType
 
-    from animeforge.backend.base import ProgressCallback
+    from animeforge.backend.base import GenerationBackend
+    from animeforge.config import AppConfig
     from animeforge.models import Project
 
 logger = logging.getLogger(__name__)
 
+# Cap the generation log so long runs don't grow the line store without bound.
+_LOG_MAX_LINES = 2000
+
+
+@dataclass(frozen=True)
+class _Phase:
+    """One row of the generation pipeline, driven by ``_run_generation``.
+
+    Phases without a ``runner`` are covered by an earlier phase and only
+    report ``done_note`` when enabled.
+    """
+
+    task_id: str
+    label: str
+    error_subject: str = ""
+    enabled: bool = True
+    skip_reason: str | None = None
+    runner: Callable[[], Awaitable[str]] | None = None
+    done_note: str = ""
+
 
 class GenerationScreen(Screen[None]):
     """Monitor and control asset generation tasks."""
@@ -82,7 +107,14 @@ class GenerationScreen(Screen[None]):
                 yield Button("Clear Log", id="btn-clear-log")
 
             # ── Log output ───────────────────────────────────
-            yield RichLog(id="gen-log", wrap=True, highlight=True, markup=True)
+            yield RichLog(
+                id="gen-log",
+                max_lines=_LOG_MAX_LINES,
+                wrap=True,
+                highlight=True,
+                markup=True,
+                auto_scroll=True,
+            )
 
             yield Label("", id="gen-status")
         yield Footer()
@@ -93,12 +125,16 @@ class GenerationScreen(Screen[None]):
 
         # Register all generation tasks with the ProgressPanel
         panel = self.query_one("#progress-panel", ProgressPanel)
-        panel.add_task("bg", "Background layers")
-        panel.add_task("char", "Character sprites")
-        panel.add_task("anim", "Animation frames")
-        panel.add_task("fx", "Effects / particles")
-        panel.add_task("tod", "Time-of-day variants")
-        panel.add_task("weather", "Weather variants")
+        panel.add_tasks(
+            [
+                ("bg", "Background layers"),
+                ("char", "Character sprites"),
+                ("anim", "Animation frames"),
+                ("fx", "Effects / particles"),
+                ("tod", "Time-of-day variants"),
+                ("weather", "Weather variants"),
+            ]
+        )
 
         log = self.query_one("#gen-log", RichLog)
         log.write("[bold magenta]AnimeForge Generator[/bold magenta] ready.")
@@ -196,184 +232,85 @@ class GenerationScreen(Screen[None]):
         def _cancelled() -> bool:
             return bool(self._cancel_event and self._cancel_event.is_set())
 
-        def _make_progress_cb(task_id: str) -> ProgressCallback:
-            """Create a progress callback that updates a task via ProgressPanel.
-
-            Since _run_generation is an async coroutine running in the
-            main event loop (not a thread), we call widget methods directly.
-            """
-
-            def cb(step: int, total: int, status: str) -> None:
-                if total > 0:
-                    pct = (step / total) * 90 + 10  # 10-100 range
-                    panel.set_progress(task_id, pct, status)
-
-            return cb
+        char_skip: str | None = None
+        if not backend_available:
+            char_skip = "no backend"
+        elif proj.character is None:
+            char_skip = "no character defined"
+
+        phases = [
+            _Phase(
+                "bg",
+                "Background layers",
+                "Background",
+                enabled=do_bg,
+                skip_reason=None if backend_available else "no backend",
+                runner=functools.partial(
+                    self._generate_backgrounds, proj, backend, config, output_dir, panel
+                ),
+            ),
+            _Phase(
+                "char",
+                "Character sprites",
+                "Character",
+                enabled=do_char,
+                skip_reason=char_skip,
+                runner=functools.partial(
+                    self._generate_characters, proj, backend, config, output_dir, panel
+                ),
+            ),
+            _Phase(
+                "anim",
+                "Animation frames",
+                enabled=do_char,
+                done_note="included in character sprites",
+            ),
+            _Phase(
+                "fx",
+                "Effects / particles",
+                "Effect",
+                enabled=do_fx,
+                runner=functools.partial(self._generate_effects, proj, output_dir, panel),
+            ),
+            _Phase(
+                "tod",
+                "Time-of-day variants",
+                enabled=do_variants,
+                done_note="included in background phase",
+            ),
+            _Phase(
+                "weather",
+                "Weather variants",
+                enabled=do_variants,
+                done_note="triggered by effect sprites",
+            ),
+        ]
 
         try:
-            # ── Phase 1: Background layers ────────────────
-            if _cancelled():
-                return
-            if do_bg:
-                if backend_available:
-                    log.write("[bold cyan]Starting:[/bold cyan] Background layers")
-                    panel.set_progress("bg", 10, "Starting...")
-                    try:
-                        bg_results = await generate_scene_backgrounds(
-                            proj.scene,
-                            backend,
-                            config,
-                            output_dir=output_dir / "backgrounds",
-                            progress_callback=_make_progress_cb("bg"),
-                        )
-                        # Update project model with generated paths
-                        if proj.scene.layers:
-                            base_layer = min(proj.scene.layers, key=lambda ly: ly.z_index)
-                            base_layer.time_variants.update(bg_results)
-                        elif bg_results:
-                            layer = Layer(id="bg-main", z_index=0, time_variants=bg_results)
-                            proj.scene.layers.append(layer)
-                        log.write(
-                            f"[bold green]Completed:[/bold green] "
-                            f"Background layers ({len(bg_results)} variants)"
-                        )
-                    except Exception as exc:
-                        log.write(
-                            f"[bold red]Error:[/bold red] Background generation failed: {exc}"
-                        )
-                        logger.exception("Background generation failed")
+            for phase in phases:
+                if _cancelled():
+                    return
+                if not phase.enabled:
+                    log.write(f"[dim]Skipped:[/dim] {phase.label} (unchecked)")
+                elif phase.runner is None:
+                    log.write(
+                        f"[bold green]Completed:[/bold green] {phase.label} ({phase.done_note})"
+                    )
+                elif phase.skip_reason:
+                    log.write(f"[dim]Skipped:[/dim] {phase.label} ({phase.skip_reason})")
                 else:
-                    log.write("[dim]Skipped:[/dim] Background layers (no backend)")
-            else:
-                log.write("[dim]Skipped:[/dim] Background layers (unchecked)")
-            panel.set_progress("bg", 100, "Done")
-
-            # ── Phase 2: Character sprites ────────────────
-            if _cancelled():
-                return
-            if do_char:
-                if backend_available and proj.character:
-                    log.write("[bold cyan]Starting:[/bold cyan] Character sprites")
-                    panel.set_progress("char", 10, "Starting...")
+                    log.write(f"[bold cyan]Starting:[/bold cyan] {phase.label}")
+                    panel.set_progress(phase.task_id, 10, "Starting...")
                     try:
-                        char_results = await generate_character_animations(
-                            proj.character,
-                            proj.scene,
-                            backend,
-                            config,
-                            output_dir=output_dir / "characters",
-                            progress_callback=_make_progress_cb("char"),
-                        )
-                        # Update animation sprite_sheet paths on project model
-                        for anim in proj.character.animations:
-                            if anim.id in char_results:
-                                anim.sprite_sheet = char_results[anim.id]
-                        log.write(
-                            f"[bold green]Completed:[/bold green] "
-                            f"Character sprites ({len(char_results)} animations)"
-                        )
+                        summary = await phase.runner()
+                        log.write(f"[bold green]Completed:[/bold green] {summary}")
                     except Exception as exc:
                         log.write(
-                            f"[bold red]Error:[/bold red] Character generation failed: {exc}"
-                        )
-                        logger.exception("Character generation failed")
-                else:
-                    reason = "no backend" if not backend_available else "no character defined"
-                    log.write(f"[dim]Skipped:[/dim] Character sprites ({reason})")
-            else:
-                log.write("[dim]Skipped:[/dim] Character sprites (unchecked)")
-            panel.set_progress("char", 100, "Done")
-
-            # ── Phase 3: Animation frames (covered by character gen above) ──
-            if do_char:
-                log.write(
-                    "[bold green]Completed:[/bold green] "
-                    "Animation frames (included in character sprites)"
-                )
-            else:
-                log.write("[dim]Skipped:[/dim] Animation frames (unchecked)")
-            panel.set_progress("anim", 100, "Done")
-
-            # ── Phase 4: Effects / particles ──────────────
-            if _cancelled():
-                return
-            if do_fx:
-                log.write("[bold cyan]Starting:[/bold cyan] Effects / particles")
-                panel.set_progress("fx", 10, "Starting...")
-                fx_dir = output_dir / "effects"
-                try:
-                    rain_path = generate_rain_sprites(fx_dir)
-                    proj.scene.effects.append(
-                        EffectDef(
-                            id="rain",
-                            type=EffectType.PARTICLE,
-                            weather_trigger=Weather.RAIN,
-                            sprite_sheet=rain_path,
-                        )
-                    )
-                    panel.set_progress("fx", 30, "Rain done")
-
-                    snow_path = generate_snow_sprites(fx_dir)
-                    proj.scene.effects.append(
-                        EffectDef(
-                            id="snow",
-                            type=EffectType.PARTICLE,
-                            weather_trigger=Weather.SNOW,
-                            sprite_sheet=snow_path,
-                        )
-                    )
-                    panel.set_progress("fx", 55, "Snow done")
-
-                    leaf_path = generate_leaf_sprites(fx_dir)
-                    proj.scene.effects.append(
-                        EffectDef(
-                            id="leaves",
-                            type=EffectType.PARTICLE,
-                            season_trigger=Season.FALL,
-                            sprite_sheet=leaf_path,
-                        )
-                    )
-                    panel.set_progress("fx", 80, "Leaves done")
-
-                    sakura_path = generate_sakura_sprites(fx_dir)
-                    proj.scene.effects.append(
-                        EffectDef(
-                            id="sakura",
-                            type=EffectType.PARTICLE,
-                            season_trigger=Season.SPRING,
-                            sprite_sheet=sakura_path,
+                            f"[bold red]Error:[/bold red] "
+                            f"{phase.error_subject} generation failed: {exc}"
                         )
-                    )
-                    log.write(
-                        f"[bold green]Completed:[/bold green] "
-                        f"Effects — rain, snow, leaves, sakura -> {fx_dir}"
-                    )
-                except Exception as exc:
-                    log.write(f"[bold red]Error:[/bold red] Effect generation failed: {exc}")
-                    logger.exception("Effect generation failed")
-            else:
-                log.write("[dim]Skipped:[/dim] Effects / particles (unchecked)")
-            panel.set_progress("fx", 100, "Done")
-
-            # ── Phase 5: Time-of-day variants (done in bg phase) ──
-            if do_variants:
-                log.write(
-                    "[bold green]Completed:[/bold green] "
-                    "Time-of-day variants (included in background phase)"
-                )
-            else:
-                log.write("[dim]Skipped:[/dim] Time-of-day variants (unchecked)")
-            panel.set_progress("tod", 100, "Done")
-
-            # ── Phase 6: Weather variants (placeholder) ───
-            if do_variants:
-                log.write(
-                    "[bold green]Completed:[/bold green] "
-                    "Weather variants (triggered by effect sprites)"
-                )
-            else:
-                log.write("[dim]Skipped:[/dim] Weather variants (unchecked)")
-            panel.set_progress("weather", 100, "Done")
+                        logger.exception("%s generation failed", phase.error_subject)
+                panel.set_progress(phase.task_id, 100, "Done")
 
         finally:
             # Always disconnect and clean up
@@ -397,6 +334,118 @@ class GenerationScreen(Screen[None]):
                 self._set_status("Generation complete!")
                 log.write("[bold green]All generation tasks complete![/bold green]")
 
+    async def _generate_backgrounds(
+        self,
+        proj: Project,
+        backend: GenerationBackend,
+        config: AppConfig,
+        output_dir: Path,
+        panel: ProgressPanel,
+    ) -> str:
+        bg_results = await generate_scene_backgrounds(
+            proj.scene,
+            backend,
+            config,
+            output_dir=output_dir / "backgrounds",
+            progress_callback=functools.partial(self._on_phase_progress, panel, "bg"),
+        )
+        # Update project model with generated paths
+        base_layer = proj.scene.base_layer
+        if base_layer is not None:
+            base_layer.time_variants.update(bg_results)
+        elif bg_results:
+            layer = Layer(id="bg-main", z_index=0, time_variants=bg_results)
+            proj.scene.layers.append(layer)
+        return f"Background layers ({len(bg_results)} variants)"
+
+    async def _generate_characters(
+        self,
+        proj: Project,
+        backend: GenerationBackend,
+        config: AppConfig,
+        output_dir: Path,
+        panel: ProgressPanel,
+    ) -> str:
+        character = proj.character
+        if character is None:
+            msg = "No character defined"
+            raise ValueError(msg)
+        char_results = await generate_character_animations(
+            character,
+            proj.scene,
+            backend,
+            config,
+            output_dir=output_dir / "characters",
+            progress_callback=functools.partial(self._on_phase_progress, panel, "char"),
+        )
+        # Update animation sprite_sheet paths on project model
+        for anim in character.animations:
+            if anim.id in char_results:
+                anim.sprite_sheet = char_results[anim.id]
+        return f"Character sprites ({len(char_results)} animations)"
+
+    async def _generate_effects(
+        self, proj: Project, output_dir: Path, panel: ProgressPanel
+    ) -> str:
+        fx_dir = output_dir / "effects"
+        rain_path = generate_rain_sprites(fx_dir)
+        proj.scene.effects.append(
+            EffectDef(
+                id="rain",
+                type=EffectType.PARTICLE,
+                weather_trigger=Weather.RAIN,
+                sprite_sheet=rain_path,
+            )
+        )
+        panel.set_progress("fx", 30, "Rain done")
+
+        snow_path = generate_snow_sprites(fx_dir)
+        proj.scene.effects.append(
+            EffectDef(
+                id="snow",
+                type=EffectType.PARTICLE,
+                weather_trigger=Weather.SNOW,
+                sprite_sheet=snow_path,
+            )
+        )
+        panel.set_progress("fx", 55, "Snow done")
+
+        leaf_path = generate_leaf_sprites(fx_dir)
+        proj.scene.effects.append(
+            EffectDef(
+                id="leaves",
+                type=EffectType.PARTICLE,
+                season_trigger=Season.FALL,
+                sprite_sheet=leaf_path,
+            )
+        )
+        panel.set_progress("fx", 80, "Leaves done")
+
+        sakura_path = generate_sakura_sprites(fx_dir)
+        proj.scene.effects.append(
+            EffectDef(
+                id="sakura",
+                type=EffectType.PARTICLE,
+                season_trigger=Season.SPRING,
+                sprite_sheet=sakura_path,
+            )
+        )
+        return f"Effects — rain, snow, leaves, sakura -> {fx_dir}"
+
+    @staticmethod
+    def _on_phase_progress(
+        panel: ProgressPanel, task_id: str, step: int, total: int, status: str
+    ) -> None:
+        """Map backend progress onto a ProgressPanel task (10-100 range).
+
+        Bound to a task with ``functools.partial``. Since _run_generation is an
+        async coroutine running in the main event loop (not a thread), widget
+        methods are called directly.
+        """
+        if total > 0:
+            pct = (step / total) * 90 + 10
+            panel.set_progress(task_id, pct, status)
+
     def _set_status(self, text: str) -> None:
         label = self.query_one("#gen-status", Label)
         label.update(text)
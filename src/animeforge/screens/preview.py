@@ -16,6 +16,14 @@ if TYPE_CHECKING:
 
     from animeforge.models import Scene
 
+_WEATHER_INDICATOR: dict[Weather, str] = {
+    Weather.RAIN: "~",
+    Weather.SNOW: "*",
+    Weather.FOG: ".",
+    Weather.SUN: "",
+    Weather.CLEAR: "",
+}
+
 
 class _SceneCanvas(Static):
     """ASCII art representation of the scene layout with zones."""
@@ -89,42 +97,42 @@ class _SceneCanvas(Static):
             zx = min(zx, canvas_w - zw - 1)
             zy = min(zy, canvas_h - zh - 1)
 
+            # Zones pushed entirely past the top/left border draw nothing.
+            if zx + zw <= 1 or zy + zh <= 1:
+                continue
+
+            # Clip the box to the canvas interior once, then draw without per-cell checks.
+            x0, x1 = max(zx, 1), min(zx + zw, canvas_w - 1)
+            y0, y1 = max(zy, 1), min(zy + zh, canvas_h - 1)
+            end_x = zx + zw - 1
+            end_y = zy + zh - 1
+
             # Draw zone box
-            for dx in range(zw):
-                cx = zx + dx
-                if 0 < cx < canvas_w - 1:
-                    if 0 < zy < canvas_h - 1:
-                        grid[zy][cx] = "="
-                    end_y = zy + zh - 1
-                    if 0 < end_y < canvas_h - 1:
-                        grid[end_y][cx] = "="
-            for dy in range(zh):
-                cy = zy + dy
-                if 0 < cy < canvas_h - 1:
-                    if 0 < zx < canvas_w - 1:
-                        grid[cy][zx] = "#"
-                    end_x = zx + zw - 1
-                    if 0 < end_x < canvas_w - 1:
-                        grid[cy][end_x] = "#"
+            edge = "=" * (x1 - x0)
+            if 0 < zy < canvas_h - 1:
+                grid[zy][x0:x1] = edge
+            if 0 < end_y < canvas_h - 1:
+                grid[end_y][x0:x1] = edge
+            for cy in range(y0, y1):
+                row = grid[cy]
+                if 0 < zx < canvas_w - 1:
+                    row[zx] = "#"
+                if 0 < end_x < canvas_w - 1:
+                    row[end_x] = "#"
 
             # Label inside zone
             label = zone.name[: zw - 2]
             label_y = zy + 1
             if 0 < label_y < canvas_h - 1:
-                for i, ch in enumerate(label):
-                    lx = zx + 1 + i
-                    if 0 < lx < canvas_w - 1:
-                        grid[label_y][lx] = ch
+                # Stamp the visible part of the label with one slice assignment.
+                start = zx + 1
+                lo = max(start, 1)
+                hi = min(start + len(label), canvas_w - 1)
+                if lo < hi:
+                    grid[label_y][lo:hi] = label[lo - start : hi - start]
 
         # Weather overlay — use a seeded RNG per scene for stable positions.
-        weather_indicator = {
-            Weather.RAIN: "~",
-            Weather.SNOW: "*",
-            Weather.FOG: ".",
-            Weather.SUN: "",
-            Weather.CLEAR: "",
-        }
-        overlay_ch = weather_indicator.get(self._weather, "")
+        overlay_ch = _WEATHER_INDICATOR.get(self._weather, "")
         if overlay_ch:
             # Seed from scene name + weather + season for stable, deterministic positions.
             seed = hash((scene.name, self._weather.value, self._season.value))
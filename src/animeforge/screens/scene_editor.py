@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import re
 import shutil
+import stat
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -26,11 +30,102 @@ from animeforge.models.enums import Season, TimeOfDay, Weather
 from animeforge.widgets import ZoneEditor
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from textual.app import ComposeResult
     from textual.binding import BindingType
     from textual.widgets._data_table import RowKey
+    from textual.worker import Worker
 
     from animeforge.app import AnimeForgeApp
+    from animeforge.models import Project
+
+
+_INPUT_IDS = (
+    "scene-name",
+    "scene-width",
+    "scene-height",
+    "bg-image-path",
+    "bg-prompt",
+    "zone-id",
+    "zone-name",
+    "zone-x",
+    "zone-y",
+    "zone-w",
+    "zone-h",
+    "zone-z",
+    "zone-anims",
+)
+_SELECT_IDS = ("scene-time", "scene-weather", "scene-season")
+# Zone-field inputs and the values they reset to for a new zone.
+_ZONE_DEFAULTS: tuple[tuple[str, str], ...] = (
+    ("zone-id", ""),
+    ("zone-name", ""),
+    ("zone-x", "0"),
+    ("zone-y", "0"),
+    ("zone-w", "200"),
+    ("zone-h", "200"),
+    ("zone-z", "1"),
+    ("zone-anims", ""),
+)
+# Inputs that feed the Scene model directly (the rest only stage zone/background edits).
+_SCENE_INPUT_IDS = frozenset(("scene-name", "scene-width", "scene-height"))
+
+# Plain decimal or exponent notation only: unlike bare float(), rejects "nan", "inf", "1_0".
+_is_number = re.compile(r"\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\s*").fullmatch
+_is_int = re.compile(r"\s*[+-]?\d+\s*").fullmatch
+
+
+def _zone_from_cells(cells: Sequence[object]) -> Zone:
+    """Build a Zone from the cells of one zone-table row.
+
+    Raises ``ValueError`` with a user-facing message if a numeric cell is invalid.
+    """
+    zone_label = str(cells[1]) or str(cells[0])
+    coords = [str(cell) for cell in cells[2:6]]
+    if not all(map(_is_number, coords)):
+        msg = f"Invalid coordinate in zone '{zone_label}' — X/Y/W/H must be numbers."
+        raise ValueError(msg)
+    if not _is_int(str(cells[6])):
+        msg = f"Invalid Z-Index in zone '{zone_label}' — must be an integer."
+        raise ValueError(msg)
+    x, y, w, h = map(float, coords)
+
+    character_animations = list(filter(None, map(str.strip, str(cells[7]).split(","))))
+    return Zone(
+        id=str(cells[0]),
+        name=str(cells[1]),
+        bounds=Rect(x=x, y=y, width=w, height=h),
+        z_index=int(str(cells[6])),
+        character_animations=character_animations,
+        interactive=str(cells[8]).lower() == "yes",
+    )
+
+
+# Zone-table rows inserted per batch when loading a scene.
+_ZONE_FILL_CHUNK = 100
+
+_TIME_OPTIONS = tuple((t.value, t) for t in TimeOfDay)
+_WEATHER_OPTIONS = tuple((w.value, w) for w in Weather)
+_SEASON_OPTIONS = tuple((s.value, s) for s in Season)
+
+
+_ZONE_COLUMNS = ("ID", "Name", "X", "Y", "W", "H", "Z", "Anims", "Interactive")
+
+
+def _zone_row(zone: Zone) -> tuple[str, ...]:
+    """Format a zone as the cells of one zone-table row (see ``_ZONE_COLUMNS``)."""
+    return (
+        zone.id,
+        zone.name,
+        str(zone.bounds.x),
+        str(zone.bounds.y),
+        str(zone.bounds.width),
+        str(zone.bounds.height),
+        str(zone.z_index),
+        ", ".join(zone.character_animations),
+        "Yes" if zone.interactive else "No",
+    )
 
 
 class SceneEditorScreen(Screen[None]):
@@ -72,21 +167,21 @@ class SceneEditorScreen(Screen[None]):
                     with Vertical(classes="col"):
                         yield Label("Default Time")
                         yield Select(
-                            [(t.value, t) for t in TimeOfDay],
+                            _TIME_OPTIONS,
                             value=TimeOfDay.DAY,
                             id="scene-time",
                         )
                     with Vertical(classes="col"):
                         yield Label("Default Weather")
                         yield Select(
-                            [(w.value, w) for w in Weather],
+                            _WEATHER_OPTIONS,
                             value=Weather.CLEAR,
                             id="scene-weather",
                         )
                     with Vertical(classes="col"):
                         yield Label("Default Season")
                         yield Select(
-                            [(s.value, s) for s in Season],
+                            _SEASON_OPTIONS,
                             value=Season.SUMMER,
                             id="scene-season",
                         )
@@ -163,15 +258,52 @@ class SceneEditorScreen(Screen[None]):
             yield Label("", id="scene-status")
         yield Footer()
 
+    @property
+    def _project(self) -> Project | None:
+        """The app's current project, or ``None`` when hosted outside AnimeForgeApp."""
+        try:
+            return self.app.current_project  # type: ignore[attr-defined, no-any-return]
+        except AttributeError:
+            return None
+
     def on_mount(self) -> None:
         self._editing_row_key: RowKey | None = None
+        # Typed zone behind every table row; the cells are only for display.
+        self._zone_rows: dict[RowKey, Zone] = {}
+        self._zone_fill: Worker[None] | None = None
+        # Set by any edit that reaches the Scene; cleared once the project is saved.
+        self._scene_dirty = True
+
+        # Resolve widget handles once; they live as long as the screen.
+        self._inputs: dict[str, Input] = {
+            input_id: self.query_one(f"#{input_id}", Input) for input_id in _INPUT_IDS
+        }
+        self._selects: dict[str, Select[Any]] = {
+            select_id: self.query_one(f"#{select_id}", Select) for select_id in _SELECT_IDS
+        }
+        self._zone_table: DataTable[Any] = self.query_one("#zone-table", DataTable)
+        self._zone_interactive = self.query_one("#zone-interactive", Checkbox)
+        self._zone_editor = self.query_one("#zone-editor", ZoneEditor)
+        self._status_label = self.query_one("#scene-status", Label)
+
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            "btn-back": self.app.pop_screen,
+            "btn-add-zone": self.action_add_zone,
+            "btn-edit-zone": self._edit_selected_zone,
+            "btn-del-zone": self.action_delete_zone,
+            "btn-save-zone": self._save_zone_from_fields,
+            "btn-cancel-zone": self._clear_zone_fields,
+            "btn-import-bg": self._import_background,
+            "btn-gen-bg": self._generate_background,
+            "btn-save-scene": self._save_scene,
+        }
 
-        table = self.query_one("#zone-table", DataTable)
-        table.add_columns("ID", "Name", "X", "Y", "W", "H", "Z", "Anims", "Interactive")
+        table = self._zone_table
+        table.add_columns(*_ZONE_COLUMNS)
         table.cursor_type = "row"
 
         # Load current project scene if available
-        proj = getattr(self.app, "_current_project", None)
+        proj = self._project
         if proj is not None:
             self._load_scene(proj.scene)
 
@@ -180,142 +312,113 @@ class SceneEditorScreen(Screen[None]):
         if not isinstance(scene, Scene):
             return
 
-        self.query_one("#scene-name", Input).value = scene.name
-        self.query_one("#scene-width", Input).value = str(scene.width)
-        self.query_one("#scene-height", Input).value = str(scene.height)
-
-        table = self.query_one("#zone-table", DataTable)
-        table.clear()
-        for zone in scene.zones:
-            table.add_row(
-                zone.id,
-                zone.name,
-                str(zone.bounds.x),
-                str(zone.bounds.y),
-                str(zone.bounds.width),
-                str(zone.bounds.height),
-                str(zone.z_index),
-                ", ".join(zone.character_animations),
-                "Yes" if zone.interactive else "No",
-            )
+        self._inputs["scene-name"].value = scene.name
+        self._inputs["scene-width"].value = str(scene.width)
+        self._inputs["scene-height"].value = str(scene.height)
 
-        self.query_one("#scene-time", Select).value = scene.default_time
-        self.query_one("#scene-weather", Select).value = scene.default_weather
-        self.query_one("#scene-season", Select).value = scene.default_season
+        self._set_table_zones(scene.zones)
+
+        self._selects["scene-time"].value = scene.default_time
+        self._selects["scene-weather"].value = scene.default_weather
+        self._selects["scene-season"].value = scene.default_season
 
         # Populate the ZoneEditor widget with zone data
-        zone_editor = self.query_one("#zone-editor", ZoneEditor)
+        zone_editor = self._zone_editor
         zone_editor.set_zones(scene.zones)
 
         self._set_status(f"Loaded scene: {scene.name} ({len(scene.zones)} zones)")
 
     # ── Button handlers ──────────────────────────────────────
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        match event.button.id:
-            case "btn-back":
-                self.app.pop_screen()
-            case "btn-add-zone":
-                self.action_add_zone()
-            case "btn-edit-zone":
-                self._edit_selected_zone()
-            case "btn-del-zone":
-                self.action_delete_zone()
-            case "btn-save-zone":
-                self._save_zone_from_fields()
-            case "btn-cancel-zone":
-                self._clear_zone_fields()
-            case "btn-import-bg":
-                self._import_background()
-            case "btn-gen-bg":
-                self._generate_background()
-            case "btn-save-scene":
-                self._save_scene()
+        handler = self._button_handlers.get(event.button.id or "")
+        if handler is not None:
+            handler()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id in _SCENE_INPUT_IDS:
+            self._scene_dirty = True
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        self._scene_dirty = True
 
     # ── Zone CRUD ────────────────────────────────────────────
     def action_add_zone(self) -> None:
         """Clear zone fields for a new zone."""
-        self.query_one("#zone-id", Input).value = ""
-        self.query_one("#zone-name", Input).value = ""
-        self.query_one("#zone-x", Input).value = "0"
-        self.query_one("#zone-y", Input).value = "0"
-        self.query_one("#zone-w", Input).value = "200"
-        self.query_one("#zone-h", Input).value = "200"
-        self.query_one("#zone-z", Input).value = "1"
-        self.query_one("#zone-anims", Input).value = ""
-        self.query_one("#zone-interactive", Checkbox).value = True
-        self.query_one("#zone-id", Input).focus()
+        self._clear_zone_fields()
+        self._inputs["zone-id"].focus()
 
     def _edit_selected_zone(self) -> None:
         """Populate zone fields from the selected table row."""
-        table = self.query_one("#zone-table", DataTable)
+        table = self._zone_table
         if table.row_count == 0:
             self._set_status("No zones to edit.")
             return
         try:
             row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
             cells = table.get_row(row_key)
-            self.query_one("#zone-id", Input).value = str(cells[0])
-            self.query_one("#zone-name", Input).value = str(cells[1])
-            self.query_one("#zone-x", Input).value = str(cells[2])
-            self.query_one("#zone-y", Input).value = str(cells[3])
-            self.query_one("#zone-w", Input).value = str(cells[4])
-            self.query_one("#zone-h", Input).value = str(cells[5])
-            self.query_one("#zone-z", Input).value = str(cells[6])
-            self.query_one("#zone-anims", Input).value = str(cells[7])
-            self.query_one("#zone-interactive", Checkbox).value = str(cells[8]).lower() == "yes"
+            self._inputs["zone-id"].value = str(cells[0])
+            self._inputs["zone-name"].value = str(cells[1])
+            self._inputs["zone-x"].value = str(cells[2])
+            self._inputs["zone-y"].value = str(cells[3])
+            self._inputs["zone-w"].value = str(cells[4])
+            self._inputs["zone-h"].value = str(cells[5])
+            self._inputs["zone-z"].value = str(cells[6])
+            self._inputs["zone-anims"].value = str(cells[7])
+            self._zone_interactive.value = str(cells[8]).lower() == "yes"
             self._editing_row_key = row_key
         except CellDoesNotExist:
             self._set_status("Select a zone row first.")
 
     def _save_zone_from_fields(self) -> None:
         """Add or update a zone in the table from the input fields."""
-        zone_id = self.query_one("#zone-id", Input).value.strip()
-        zone_name = self.query_one("#zone-name", Input).value.strip()
+        zone_id = self._inputs["zone-id"].value.strip()
+        zone_name = self._inputs["zone-name"].value.strip()
 
         if not zone_id or not zone_name:
             self._set_status("Zone ID and Name are required.")
             return
 
-        x = self.query_one("#zone-x", Input).value
-        y = self.query_one("#zone-y", Input).value
-        w = self.query_one("#zone-w", Input).value
-        h = self.query_one("#zone-h", Input).value
-        z = self.query_one("#zone-z", Input).value
-        anims = self.query_one("#zone-anims", Input).value
-        interactive = self.query_one("#zone-interactive", Checkbox).value
+        fields = [zone_id, zone_name]
+        fields.extend(self._inputs[input_id].value for input_id, _ in _ZONE_DEFAULTS[2:])
+        fields.append("Yes" if self._zone_interactive.value else "No")
+        try:
+            zone = _zone_from_cells(fields)
+        except ValueError as exc:
+            self._set_status(str(exc))
+            return
 
-        table = self.query_one("#zone-table", DataTable)
+        table = self._zone_table
 
         # Check if editing existing row
         editing_key = getattr(self, "_editing_row_key", None)
         if editing_key is not None:
             table.remove_row(editing_key)
+            self._zone_rows.pop(editing_key, None)
             self._editing_row_key = None
 
-        table.add_row(zone_id, zone_name, x, y, w, h, z, anims, "Yes" if interactive else "No")
+        # Show the values as typed; the parsed zone is what gets saved.
+        row_key = table.add_row(*fields)
+        self._scene_dirty = True
+        self._zone_rows[row_key] = zone
         self._set_status(f"Zone '{zone_name}' saved.")
         self._clear_zone_fields()
         self._sync_zone_editor_from_table()
 
     def _clear_zone_fields(self) -> None:
-        self.query_one("#zone-id", Input).value = ""
-        self.query_one("#zone-name", Input).value = ""
-        self.query_one("#zone-x", Input).value = "0"
-        self.query_one("#zone-y", Input).value = "0"
-        self.query_one("#zone-w", Input).value = "200"
-        self.query_one("#zone-h", Input).value = "200"
-        self.query_one("#zone-z", Input).value = "1"
-        self.query_one("#zone-anims", Input).value = ""
-        self.query_one("#zone-interactive", Checkbox).value = True
+        for input_id, default in _ZONE_DEFAULTS:
+            self._inputs[input_id].value = default
+        self._zone_interactive.value = True
         self._editing_row_key = None
 
     def action_delete_zone(self) -> None:
-        table = self.query_one("#zone-table", DataTable)
+        table = self._zone_table
         if table.row_count == 0:
             return
         try:
             row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
             table.remove_row(row_key)
+            self._zone_rows.pop(row_key, None)
+            self._scene_dirty = True
             self._set_status("Zone deleted.")
             self._sync_zone_editor_from_table()
         except CellDoesNotExist:
@@ -324,117 +427,150 @@ class SceneEditorScreen(Screen[None]):
     # ── ZoneEditor sync ─────────────────────────────────────
     def on_zone_editor_changed(self, event: ZoneEditor.Changed) -> None:
         """Sync zones from ZoneEditor widget back to the main zone table."""
-        table = self.query_one("#zone-table", DataTable)
-        table.clear()
-        for zone in event.zones:
-            table.add_row(
-                zone.id,
-                zone.name,
-                str(zone.bounds.x),
-                str(zone.bounds.y),
-                str(zone.bounds.width),
-                str(zone.bounds.height),
-                str(zone.z_index),
-                ", ".join(zone.character_animations),
-                "Yes" if zone.interactive else "No",
-            )
+        self._set_table_zones(event.zones)
         self._set_status(f"Zones updated via Zone Editor ({len(event.zones)} zones)")
 
+    def _set_table_zones(self, zones: list[Zone]) -> None:
+        """Replace the zone table contents with *zones*.
+
+        The first chunk is added right away; the rest of a large scene is
+        filled in by a worker so pushing the screen stays responsive.
+        """
+        if self._zone_fill is not None:
+            self._zone_fill.cancel()
+            self._zone_fill = None
+        self._zone_table.clear()
+        self._zone_rows = {}
+        self._scene_dirty = True
+        self._add_table_zones(zones[:_ZONE_FILL_CHUNK])
+        if len(zones) > _ZONE_FILL_CHUNK:
+            self._zone_fill = self.run_worker(
+                self._fill_table_zones(zones[_ZONE_FILL_CHUNK:]), group="zone-fill"
+            )
+
+    def _add_table_zones(self, zones: list[Zone]) -> None:
+        with self.app.batch_update():
+            row_keys = self._zone_table.add_rows([_zone_row(zone) for zone in zones])
+        self._zone_rows.update(zip(row_keys, zones, strict=True))
+
+    async def _fill_table_zones(self, zones: list[Zone]) -> None:
+        for start in range(0, len(zones), _ZONE_FILL_CHUNK):
+            # Yield to the event loop between chunks so input is handled.
+            await asyncio.sleep(0)
+            self._add_table_zones(zones[start : start + _ZONE_FILL_CHUNK])
+        # Zone edits made while loading skipped the sync; push the final table now.
+        self._zone_fill = None
+        self._sync_zone_editor_from_table()
+
+    @property
+    def _zones_loading(self) -> bool:
+        return self._zone_fill is not None and not self._zone_fill.is_finished
+
     def _sync_zone_editor_from_table(self) -> None:
         """Sync zones from the main DataTable to the ZoneEditor widget."""
-        zones: list[Zone] = []
-        table = self.query_one("#zone-table", DataTable)
-        for row_key in table.rows:
-            cells = table.get_row(row_key)
-            try:
-                bounds = Rect(
-                    x=float(cells[2]),
-                    y=float(cells[3]),
-                    width=float(cells[4]),
-                    height=float(cells[5]),
-                )
-                z_index = int(cells[6])
-            except (ValueError, IndexError):
-                continue
-            anims_raw = str(cells[7]).strip() if len(cells) > 7 else ""
-            character_animations = (
-                [a.strip() for a in anims_raw.split(",") if a.strip()] if anims_raw else []
-            )
-            interactive = str(cells[8]).lower() == "yes" if len(cells) > 8 else True
-            zones.append(
-                Zone(
-                    id=str(cells[0]),
-                    name=str(cells[1]),
-                    bounds=bounds,
-                    z_index=z_index,
-                    character_animations=character_animations,
-                    interactive=interactive,
-                )
-            )
-        zone_editor = self.query_one("#zone-editor", ZoneEditor)
+        if self._zones_loading:
+            return
+        zones = [self._zone_rows[row_key] for row_key in self._zone_table.rows]
+        zone_editor = self._zone_editor
         zone_editor.set_zones(zones)
 
     # ── Background ───────────────────────────────────────────
     def _import_background(self) -> None:
-        path_str = self.query_one("#bg-image-path", Input).value.strip()
+        path_str = self._inputs["bg-image-path"].value.strip()
         if not path_str:
             self._set_status("Enter a background image path first.")
             return
-        path = Path(path_str).expanduser().resolve()
-        if not path.exists():
+        # absolute() is pure path arithmetic; the single stat() below is the only
+        # filesystem hit before the copy.
+        path = Path(path_str).expanduser().absolute()
+        try:
+            is_file = stat.S_ISREG(path.stat().st_mode)
+        except OSError:
+            is_file = False
+        if not is_file:
             self._set_status(f"File not found: {path}")
             return
 
-        proj = getattr(self.app, "_current_project", None)
+        proj = self._project
         if proj is None:
             self._set_status("No project loaded. Create a project first.")
             return
 
-        # Copy image into project directory
-        if proj.project_dir:
-            bg_dir = Path(proj.project_dir) / "backgrounds"
-            bg_dir.mkdir(parents=True, exist_ok=True)
-            dest = bg_dir / path.name
-            shutil.copy2(path, dest)
-        else:
-            dest = path
+        if not proj.project_dir:
+            self._set_background_layer(proj, path)
+            return
 
-        # Add or update the base background layer on the scene
-        if proj.scene.layers:
-            base_layer = min(proj.scene.layers, key=lambda ly: ly.z_index)
-            base_layer.image_path = dest
+        # Copy image into project directory off the event loop; large images
+        # would otherwise freeze the UI for the duration of the copy.
+        dest = Path(proj.project_dir) / "backgrounds" / path.name
+        self._set_status(f"Importing background: {path.name}...")
+        self.run_worker(
+            functools.partial(self._copy_background, proj, path, dest),
+            group="bg-import",
+            thread=True,
+        )
+
+    def _copy_background(self, proj: Project, src: Path, dest: Path) -> None:
+        """Copy a background image into the project (runs in a worker thread)."""
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dest)
+        except OSError as exc:
+            self.app.call_from_thread(self._set_status, f"Error importing background: {exc}")
+            return
+        self.app.call_from_thread(self._set_background_layer, proj, dest)
+
+    def _set_background_layer(self, proj: Project, image_path: Path) -> None:
+        """Point the scene's base background layer at *image_path*."""
+        self._scene_dirty = True
+        base_layer = proj.scene.base_layer
+        if base_layer is not None:
+            base_layer.image_path = image_path
         else:
-            layer = Layer(id="bg-main", z_index=0, image_path=dest)
+            layer = Layer(id="bg-main", z_index=0, image_path=image_path)
             proj.scene.layers.append(layer)
 
-        self._set_status(f"Background imported: {path.name}")
+        self._set_status(f"Background imported: {image_path.name}")
 
     def _generate_background(self) -> None:
-        prompt = self.query_one("#bg-prompt", Input).value.strip()
+        prompt = self._inputs["bg-prompt"].value.strip()
         if not prompt:
             self._set_status("Enter a text prompt for background generation.")
             return
 
         # Store prompt on project so generation knows what to generate
-        proj = getattr(self.app, "_current_project", None)
+        proj = self._project
         if proj is None:
             self._set_status("No project loaded. Create a project first.")
             return
 
         # Store the prompt in the scene description for generation.
         proj.scene.description = prompt
-        scene_name = self.query_one("#scene-name", Input).value.strip()
+        self._scene_dirty = True
+        scene_name = self._inputs["scene-name"].value.strip()
         if not scene_name:
             proj.scene.name = prompt[:60]
         else:
             proj.scene.name = scene_name
 
+        # Persist the staged prompt before leaving; the write runs off the event
+        # loop so the editor stays responsive on slow disks.
+        self.run_worker(
+            functools.partial(self._save_before_generation, proj, prompt),
+            group="bg-generate",
+            thread=True,
+        )
+
+    def _save_before_generation(self, proj: Project, prompt: str) -> None:
+        """Save the project, then open the generation screen (runs in a worker thread)."""
         try:
             proj.save()
         except (OSError, ValueError) as exc:
-            self._set_status(f"Error saving before generation: {exc}")
+            self.app.call_from_thread(self._set_status, f"Error saving before generation: {exc}")
             return
+        self.app.call_from_thread(self._open_generation, prompt)
 
+    def _open_generation(self, prompt: str) -> None:
         self._set_status(f"Background generation queued: '{prompt[:50]}...'")
         app: AnimeForgeApp = self.app  # type: ignore[assignment]
         app.navigate("generation")
@@ -442,65 +578,35 @@ class SceneEditorScreen(Screen[None]):
     # ── Save ─────────────────────────────────────────────────
     def _save_scene(self) -> None:
         """Build a Scene model from the UI and save to current project."""
-        scene_name = self.query_one("#scene-name", Input).value.strip() or "Untitled"
+        if self._zones_loading:
+            self._set_status("Zones are still loading — try again in a moment.")
+            return
+        if not self._scene_dirty:
+            self._set_status("No changes to save.")
+            return
+        scene_name = self._inputs["scene-name"].value.strip() or "Untitled"
 
         try:
-            width = int(self.query_one("#scene-width", Input).value or 1920)
+            width = int(self._inputs["scene-width"].value or 1920)
         except ValueError:
             self._set_status("Invalid value for Width — must be an integer.")
             return
         try:
-            height = int(self.query_one("#scene-height", Input).value or 1080)
+            height = int(self._inputs["scene-height"].value or 1080)
         except ValueError:
             self._set_status("Invalid value for Height — must be an integer.")
             return
 
-        time_select = self.query_one("#scene-time", Select)
-        weather_select = self.query_one("#scene-weather", Select)
-        season_select = self.query_one("#scene-season", Select)
+        time_select = self._selects["scene-time"]
+        weather_select = self._selects["scene-weather"]
+        season_select = self._selects["scene-season"]
 
-        zones: list[Zone] = []
-        table = self.query_one("#zone-table", DataTable)
-        for row_key in table.rows:
-            cells = table.get_row(row_key)
-            zone_label = str(cells[1]) or str(cells[0])
-            try:
-                bounds = Rect(
-                    x=float(cells[2]),
-                    y=float(cells[3]),
-                    width=float(cells[4]),
-                    height=float(cells[5]),
-                )
-            except ValueError:
-                self._set_status(
-                    f"Invalid coordinate in zone '{zone_label}' — X/Y/W/H must be numbers."
-                )
-                return
-            try:
-                z_index = int(cells[6])
-            except ValueError:
-                self._set_status(f"Invalid Z-Index in zone '{zone_label}' — must be an integer.")
-                return
-
-            anims_raw = str(cells[7]).strip()
-            character_animations = (
-                [a.strip() for a in anims_raw.split(",") if a.strip()] if anims_raw else []
-            )
-            interactive = str(cells[8]).lower() == "yes"
-
-            zones.append(
-                Zone(
-                    id=str(cells[0]),
-                    name=str(cells[1]),
-                    bounds=bounds,
-                    z_index=z_index,
-                    character_animations=character_animations,
-                    interactive=interactive,
-                )
-            )
+        # Every table row has its typed zone in _zone_rows; no cell parsing here.
+        zones = [self._zone_rows[row_key] for row_key in self._zone_table.rows]
 
         # Preserve existing fields not editable in the UI.
-        existing = getattr(getattr(self.app, "_current_project", None), "scene", None)
+        proj = self._project
+        existing = proj.scene if proj is not None else None
         existing_desc = existing.description if existing else ""
         existing_layers = existing.layers if existing else []
         existing_effects = existing.effects if existing else []
@@ -529,11 +635,11 @@ class SceneEditorScreen(Screen[None]):
 
         scene = Scene(**kwargs)
 
-        proj = getattr(self.app, "_current_project", None)
         if proj is not None:
             proj.scene = scene
             try:
                 proj.save()
+                self._scene_dirty = False
                 self._set_status(f"Scene '{scene_name}' saved to project.")
             except (OSError, ValueError) as exc:
                 self._set_status(f"Error saving: {exc}")
@@ -541,5 +647,4 @@ class SceneEditorScreen(Screen[None]):
             self._set_status("No project loaded. Create a project from the Dashboard first.")
 
     def _set_status(self, text: str) -> None:
-        label = self.query_one("#scene-status", Label)
-        label.update(text)
+        self._status_label.update(text)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import io
 import os
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -14,6 +17,7 @@ from textual.widgets import Button, Footer, Header, Input, Label, Select, Static
 from animeforge.config import AppConfig, load_config
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
     from textual.app import ComposeResult
@@ -21,6 +25,10 @@ if TYPE_CHECKING:
 HTTP_OK = 200
 HTTP_UNAUTHORIZED = 401
 
+# Repeat Test Connection presses within this window are ignored.
+_TEST_COOLDOWN_SECONDS = 1.0
+_HTTP_KEEPALIVE = 4
+
 _BACKEND_OPTIONS = [
     ("ComfyUI (local GPU)", "comfyui"),
     ("fal.ai (cloud)", "fal"),
@@ -28,6 +36,67 @@ _BACKEND_OPTIONS = [
 ]
 
 
+def _toml_string(value: object) -> str:
+    return f'"{value}"'
+
+
+# Exact-type dispatch for the fallback writer; anything else is written as a string.
+_TOML_SCALARS: dict[type, Callable[[Any], str]] = {
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: str,
+}
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Write *payload* to a sibling temp file, then swap it into place."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+@dataclass(frozen=True)
+class _Field:
+    """One settings input and where its value goes in config.toml."""
+
+    input_id: str
+    path: tuple[str, ...]
+    # Numeric fields: parser, value used when the input is blank, and the label
+    # shown if parsing fails. Text fields are written through unchanged.
+    parse: Callable[[str], int | float] | None = None
+    blank: int | float = 0
+    label: str = ""
+
+
+# In config.toml order; numeric inputs are validated in this order too.
+_FIELDS: tuple[_Field, ...] = (
+    _Field("dir-config", ("config_dir",)),
+    _Field("dir-projects", ("projects_dir",)),
+    _Field("comfy-host", ("comfyui", "host")),
+    _Field("comfy-port", ("comfyui", "port"), int, 8188, "Port"),
+    _Field("fal-api-key", ("fal", "api_key")),
+    _Field("fal-default-model", ("fal", "default_model")),
+    _Field("fal-controlnet-model", ("fal", "controlnet_model")),
+    _Field("fal-ipadapter-model", ("fal", "ip_adapter_model")),
+    _Field("model-checkpoint", ("models", "checkpoint")),
+    _Field("model-openpose", ("models", "controlnet_openpose")),
+    _Field("model-depth", ("models", "controlnet_depth")),
+    _Field("model-canny", ("models", "controlnet_canny")),
+    _Field("model-ipadapter", ("models", "ip_adapter")),
+    _Field("model-vae", ("models", "vae")),
+    _Field("gen-width", ("generation", "width"), int, 1024, "Width"),
+    _Field("gen-height", ("generation", "height"), int, 1024, "Height"),
+    _Field("gen-steps", ("generation", "steps"), int, 30, "Steps"),
+    _Field("gen-cfg", ("generation", "cfg_scale"), float, 7.0, "CFG Scale"),
+    _Field("gen-sampler", ("generation", "sampler")),
+    _Field("gen-scheduler", ("generation", "scheduler")),
+    _Field("gen-batch-size", ("generation", "batch_size"), int, 1, "Batch Size"),
+    _Field("gen-seed", ("generation", "seed"), int, -1, "Seed"),
+)
+
+_INPUT_IDS = tuple(field.input_id for field in _FIELDS)
+
+
 class SettingsScreen(Screen[None]):
     """Configure AI backend, model paths, and generation defaults."""
 
@@ -227,100 +296,74 @@ class SettingsScreen(Screen[None]):
             yield Label("", id="settings-status")
         yield Footer()
 
+    def on_mount(self) -> None:
+        # Resolve widget handles once; they live as long as the screen.
+        self._inputs: dict[str, Input] = {
+            input_id: self.query_one(f"#{input_id}", Input) for input_id in _INPUT_IDS
+        }
+        self._backend_select: Select[str] = self.query_one("#active-backend", Select)
+        self._comfy_ssl = self.query_one("#comfy-ssl", Switch)
+        self._status_label = self.query_one("#settings-status", Label)
+        # Shared by connection tests so repeat clicks reuse pooled connections.
+        self._http_client: httpx.AsyncClient | None = None
+        self._last_test_at = -_TEST_COOLDOWN_SECONDS
+
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            "btn-back": self.app.pop_screen,
+            "btn-save": self._save_settings,
+            "btn-reset": self._reset_defaults,
+            "btn-test": self._test_connection,
+        }
+
+    async def on_unmount(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=_HTTP_KEEPALIVE)
+            )
+        return self._http_client
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        match event.button.id:
-            case "btn-back":
-                self.app.pop_screen()
-            case "btn-save":
-                self._save_settings()
-            case "btn-reset":
-                self._reset_defaults()
-            case "btn-test":
-                self._test_connection()
+        handler = self._button_handlers.get(event.button.id or "")
+        if handler is not None:
+            handler()
 
     def _save_settings(self) -> None:
         """Collect inputs and write config.toml."""
         config = load_config()
+        inputs = self._inputs
 
-        try:
-            port = int(self.query_one("#comfy-port", Input).value or 8188)
-        except ValueError:
-            self._set_status("Invalid Port — must be an integer.")
-            return
-        try:
-            gen_width = int(self.query_one("#gen-width", Input).value or 1024)
-        except ValueError:
-            self._set_status("Invalid Width — must be an integer.")
-            return
-        try:
-            gen_height = int(self.query_one("#gen-height", Input).value or 1024)
-        except ValueError:
-            self._set_status("Invalid Height — must be an integer.")
-            return
-        try:
-            gen_steps = int(self.query_one("#gen-steps", Input).value or 30)
-        except ValueError:
-            self._set_status("Invalid Steps — must be an integer.")
-            return
-        try:
-            gen_cfg = float(self.query_one("#gen-cfg", Input).value or 7.0)
-        except ValueError:
-            self._set_status("Invalid CFG Scale — must be a number.")
-            return
-        try:
-            gen_batch_size = int(self.query_one("#gen-batch-size", Input).value or 1)
-        except ValueError:
-            self._set_status("Invalid Batch Size — must be an integer.")
-            return
-        try:
-            gen_seed = int(self.query_one("#gen-seed", Input).value or -1)
-        except ValueError:
-            self._set_status("Invalid Seed — must be an integer.")
-            return
-
-        backend_select = self.query_one("#active-backend", Select)
+        backend_select = self._backend_select
         active_backend = str(backend_select.value) if backend_select.value else "comfyui"
 
-        data: dict[str, Any] = {
-            "active_backend": active_backend,
-            "config_dir": self.query_one("#dir-config", Input).value,
-            "projects_dir": self.query_one("#dir-projects", Input).value,
-            "comfyui": {
-                "host": self.query_one("#comfy-host", Input).value,
-                "port": port,
-                "use_ssl": self.query_one("#comfy-ssl", Switch).value,
-            },
-            "fal": {
-                "api_key": self.query_one("#fal-api-key", Input).value,
-                "default_model": self.query_one("#fal-default-model", Input).value,
-                "controlnet_model": self.query_one("#fal-controlnet-model", Input).value,
-                "ip_adapter_model": self.query_one("#fal-ipadapter-model", Input).value,
-            },
-            "models": {
-                "checkpoint": self.query_one("#model-checkpoint", Input).value,
-                "controlnet_openpose": self.query_one("#model-openpose", Input).value,
-                "controlnet_depth": self.query_one("#model-depth", Input).value,
-                "controlnet_canny": self.query_one("#model-canny", Input).value,
-                "ip_adapter": self.query_one("#model-ipadapter", Input).value,
-                "vae": self.query_one("#model-vae", Input).value,
-            },
-            "generation": {
-                "width": gen_width,
-                "height": gen_height,
-                "steps": gen_steps,
-                "cfg_scale": gen_cfg,
-                "sampler": self.query_one("#gen-sampler", Input).value,
-                "scheduler": self.query_one("#gen-scheduler", Input).value,
-                "batch_size": gen_batch_size,
-                "seed": gen_seed,
-            },
-        }
+        data: dict[str, Any] = {"active_backend": active_backend}
+        for field in _FIELDS:
+            raw = inputs[field.input_id].value
+            value: object = raw
+            if field.parse is not None:
+                try:
+                    value = field.parse(raw) if raw else field.blank
+                except ValueError:
+                    kind = "a number" if field.parse is float else "an integer"
+                    self._set_status(f"Invalid {field.label} — must be {kind}.")
+                    return
+            *tables, key = field.path
+            target = data
+            for table in tables:
+                target = target.setdefault(table, {})
+            target[key] = value
+        data["comfyui"]["use_ssl"] = self._comfy_ssl.value
 
         config_path = config.config_dir / "config.toml"
         config.config_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            config_path.write_bytes(tomli_w.dumps(data).encode())
+            # Serialize fully before writing, so a failed dump leaves the old file intact.
+            _write_atomic(config_path, tomli_w.dumps(data).encode())
             self._set_status(f"Settings saved to {config_path}")
         except ImportError:
             self._write_toml_fallback(config_path, data)
@@ -331,55 +374,56 @@ class SettingsScreen(Screen[None]):
     @staticmethod
     def _write_toml_fallback(path: Path, data: dict[str, Any]) -> None:
         """Minimal TOML writer for flat/one-level-nested dicts."""
-        lines: list[str] = []
+        buf = io.StringIO()
         for key, value in data.items():
             if isinstance(value, dict):
-                lines.append(f"\n[{key}]")
+                buf.write(f"\n[{key}]\n")
                 for k, v in value.items():
-                    if isinstance(v, bool):
-                        lines.append(f"{k} = {'true' if v else 'false'}")
-                    elif isinstance(v, (int, float)):
-                        lines.append(f"{k} = {v}")
-                    else:
-                        lines.append(f'{k} = "{v}"')
+                    buf.write(f"{k} = {_TOML_SCALARS.get(type(v), _toml_string)(v)}\n")
             else:
-                lines.append(f'{key} = "{value}"')
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+                buf.write(f"{key} = {_toml_string(value)}\n")
+        _write_atomic(path, buf.getvalue().encode())
 
     def _reset_defaults(self) -> None:
         """Reset all inputs to defaults."""
         defaults = AppConfig()
-
-        self.query_one("#active-backend", Select).value = defaults.active_backend
-        self.query_one("#comfy-host", Input).value = defaults.comfyui.host
-        self.query_one("#comfy-port", Input).value = str(defaults.comfyui.port)
-        self.query_one("#comfy-ssl", Switch).value = defaults.comfyui.use_ssl
-        self.query_one("#fal-api-key", Input).value = defaults.fal.api_key
-        self.query_one("#fal-default-model", Input).value = defaults.fal.default_model
-        self.query_one("#fal-controlnet-model", Input).value = defaults.fal.controlnet_model
-        self.query_one("#fal-ipadapter-model", Input).value = defaults.fal.ip_adapter_model
-        self.query_one("#model-checkpoint", Input).value = defaults.models.checkpoint
-        self.query_one("#model-openpose", Input).value = defaults.models.controlnet_openpose
-        self.query_one("#model-depth", Input).value = defaults.models.controlnet_depth
-        self.query_one("#model-canny", Input).value = defaults.models.controlnet_canny
-        self.query_one("#model-ipadapter", Input).value = defaults.models.ip_adapter
-        self.query_one("#model-vae", Input).value = defaults.models.vae
-        self.query_one("#gen-width", Input).value = str(defaults.generation.width)
-        self.query_one("#gen-height", Input).value = str(defaults.generation.height)
-        self.query_one("#gen-steps", Input).value = str(defaults.generation.steps)
-        self.query_one("#gen-cfg", Input).value = str(defaults.generation.cfg_scale)
-        self.query_one("#gen-sampler", Input).value = defaults.generation.sampler
-        self.query_one("#gen-scheduler", Input).value = defaults.generation.scheduler
-        self.query_one("#gen-batch-size", Input).value = str(defaults.generation.batch_size)
-        self.query_one("#gen-seed", Input).value = str(defaults.generation.seed)
-        self.query_one("#dir-config", Input).value = str(defaults.config_dir)
-        self.query_one("#dir-projects", Input).value = str(defaults.projects_dir)
+        inputs = self._inputs
+
+        self._backend_select.value = defaults.active_backend
+        inputs["comfy-host"].value = defaults.comfyui.host
+        inputs["comfy-port"].value = str(defaults.comfyui.port)
+        self._comfy_ssl.value = defaults.comfyui.use_ssl
+        inputs["fal-api-key"].value = defaults.fal.api_key
+        inputs["fal-default-model"].value = defaults.fal.default_model
+        inputs["fal-controlnet-model"].value = defaults.fal.controlnet_model
+        inputs["fal-ipadapter-model"].value = defaults.fal.ip_adapter_model
+        inputs["model-checkpoint"].value = defaults.models.checkpoint
+        inputs["model-openpose"].value = defaults.models.controlnet_openpose
+        inputs["model-depth"].value = defaults.models.controlnet_depth
+        inputs["model-canny"].value = defaults.models.controlnet_canny
+        inputs["model-ipadapter"].value = defaults.models.ip_adapter
+        inputs["model-vae"].value = defaults.models.vae
+        inputs["gen-width"].value = str(defaults.generation.width)
+        inputs["gen-height"].value = str(defaults.generation.height)
+        inputs["gen-steps"].value = str(defaults.generation.steps)
+        inputs["gen-cfg"].value = str(defaults.generation.cfg_scale)
+        inputs["gen-sampler"].value = defaults.generation.sampler
+        inputs["gen-scheduler"].value = defaults.generation.scheduler
+        inputs["gen-batch-size"].value = str(defaults.generation.batch_size)
+        inputs["gen-seed"].value = str(defaults.generation.seed)
+        inputs["dir-config"].value = str(defaults.config_dir)
+        inputs["dir-projects"].value = str(defaults.projects_dir)
 
         self._set_status("Reset to defaults (not yet saved).")
 
     def _test_connection(self) -> None:
         """Test connectivity for the selected backend."""
-        backend_select = self.query_one("#active-backend", Select)
+        now = time.monotonic()
+        if now - self._last_test_at < _TEST_COOLDOWN_SECONDS:
+            return
+        self._last_test_at = now
+
+        backend_select = self._backend_select
         active = str(backend_select.value) if backend_select.value else "comfyui"
 
         if active == "mock":
@@ -391,9 +435,10 @@ class SettingsScreen(Screen[None]):
             return
 
         # Default: test ComfyUI
-        host = self.query_one("#comfy-host", Input).value
-        port = self.query_one("#comfy-port", Input).value
-        ssl = self.query_one("#comfy-ssl", Switch).value
+        inputs = self._inputs
+        host = inputs["comfy-host"].value
+        port = inputs["comfy-port"].value
+        ssl = self._comfy_ssl.value
         scheme = "https" if ssl else "http"
         url = f"{scheme}://{host}:{port}/system_stats"
 
@@ -401,22 +446,21 @@ class SettingsScreen(Screen[None]):
 
         async def _check() -> None:
             try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    resp = await client.get(url)
-                    if resp.status_code == HTTP_OK:
-                        self._set_status(f"Connected to ComfyUI at {host}:{port}")
-                    else:
-                        self._set_status(f"ComfyUI returned status {resp.status_code}")
+                resp = await self._client().get(url, timeout=5.0)
+                if resp.status_code == HTTP_OK:
+                    self._set_status(f"Connected to ComfyUI at {host}:{port}")
+                else:
+                    self._set_status(f"ComfyUI returned status {resp.status_code}")
             except ImportError:
                 self._set_status("httpx not installed — cannot test connection.")
             except Exception as exc:  # noqa: BLE001
                 self._set_status(f"Connection failed: {exc}")
 
-        self.run_worker(_check())
+        self.run_worker(_check(), group="connection-test", exclusive=True)
 
     def _test_fal_connection(self) -> None:
         """Test fal.ai API connectivity."""
-        api_key = self.query_one("#fal-api-key", Input).value or os.environ.get("FAL_KEY", "")
+        api_key = self._inputs["fal-api-key"].value or os.environ.get("FAL_KEY", "")
         if not api_key:
             self._set_status("fal.ai: No API key set (enter key or set FAL_KEY env var)")
             return
@@ -425,20 +469,19 @@ class SettingsScreen(Screen[None]):
 
         async def _check() -> None:
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    resp = await client.get(
-                        "https://queue.fal.run/fal-ai/pony-v7",
-                        headers={"Authorization": f"Key {api_key}"},
-                    )
-                    if resp.status_code == HTTP_UNAUTHORIZED:
-                        self._set_status("fal.ai: Invalid API key")
-                    else:
-                        self._set_status("fal.ai: Connected successfully")
+                resp = await self._client().get(
+                    "https://queue.fal.run/fal-ai/pony-v7",
+                    headers={"Authorization": f"Key {api_key}"},
+                    timeout=10.0,
+                )
+                if resp.status_code == HTTP_UNAUTHORIZED:
+                    self._set_status("fal.ai: Invalid API key")
+                else:
+                    self._set_status("fal.ai: Connected successfully")
             except Exception as exc:  # noqa: BLE001
                 self._set_status(f"fal.ai connection failed: {exc}")
 
-        self.run_worker(_check())
+        self.run_worker(_check(), group="connection-test", exclusive=True)
 
     def _set_status(self, text: str) -> None:
-        label = self.query_one("#settings-status", Label)
-        label.update(text)
+        self._status_label.update(text)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from textual.message import Message
 from textual.widget import Widget
@@ -11,10 +11,42 @@ from textual.widgets import Button, DataTable, Static
 from animeforge.models.enums import AnimationState
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from textual.app import ComposeResult
+    from textual.widgets.data_table import RowKey
 
     from animeforge.models import AnimationDef
 
+_DESCRIPTIONS: dict[AnimationState, str] = {
+    AnimationState.IDLE: "Character at rest, subtle breathing",
+    AnimationState.TYPING: "Typing on keyboard, finger movement",
+    AnimationState.READING: "Reading a book or screen",
+    AnimationState.DRINKING: "Sipping from a cup",
+    AnimationState.STRETCHING: "Arms-up stretch animation",
+    AnimationState.LOOKING_WINDOW: "Gazing out the window",
+}
+
+# (state, description) rows of the built-in table, in enum order.
+_BUILTIN_ROWS: tuple[tuple[str, str], ...] = tuple(
+    (state.value, _DESCRIPTIONS.get(state, "")) for state in AnimationState
+)
+
+_POSES: dict[str, str] = {
+    "idle": ("  O  \n /|\\ \n / \\ \n     \n~ relaxed stance ~"),
+    "typing": ("  O  \n /|\\ \n _||_\n / \\ \n~ fingers on keyboard ~"),
+    "reading": ("  O  \n /|] \n / \\ \n     \n~ holding a book ~"),
+    "drinking": ("  O  \n /|D \n / \\ \n     \n~ sipping coffee ~"),
+    "stretching": (" \\O/ \n  |  \n / \\ \n     \n~ arms up stretch ~"),
+    "looking_window": ("  O > \n /|\\  \n / \\  \n      \n~ gazing outside ~"),
+}
+_DEFAULT_POSE = "  O\n /|\\\n / \\\n~ unknown pose ~"
+
+
+def _custom_row(anim: AnimationDef) -> tuple[str, ...]:
+    """Format an animation as the cells of one custom-table row."""
+    return (anim.id, anim.name, anim.zone_id, str(anim.fps), str(anim.frame_count))
+
 
 class AnimationPicker(Widget):
     """Browse available animation states and select one.
@@ -85,6 +117,12 @@ class AnimationPicker(Widget):
     ) -> None:
         super().__init__(name=name, id=id, classes=classes)
         self._custom_animations: list[AnimationDef] = list(animations or [])
+        # Custom-table row per animation id, in display order.
+        self._row_keys: dict[str, RowKey] = {}
+        self._button_handlers: dict[str, Callable[[], None]] = {
+            "ap-btn-select-builtin": self._select_from_builtin,
+            "ap-btn-select-custom": self._select_from_custom,
+        }
 
     def compose(self) -> ComposeResult:
         yield Static("Animation Picker", classes="ap-title")
@@ -108,46 +146,52 @@ class AnimationPicker(Widget):
         builtin_table.add_columns("State", "Description")
         builtin_table.cursor_type = "row"
 
-        descriptions = {
-            AnimationState.IDLE: "Character at rest, subtle breathing",
-            AnimationState.TYPING: "Typing on keyboard, finger movement",
-            AnimationState.READING: "Reading a book or screen",
-            AnimationState.DRINKING: "Sipping from a cup",
-            AnimationState.STRETCHING: "Arms-up stretch animation",
-            AnimationState.LOOKING_WINDOW: "Gazing out the window",
-        }
-
-        for state in AnimationState:
-            desc = descriptions.get(state, "")
-            builtin_table.add_row(state.value, desc)
+        builtin_table.add_rows(_BUILTIN_ROWS)
 
         # Custom animations table
         custom_table = self.query_one("#ap-custom-table", DataTable)
-        custom_table.add_columns("ID", "Name", "Zone", "FPS", "Frames")
+        self._custom_columns = custom_table.add_columns("ID", "Name", "Zone", "FPS", "Frames")
         custom_table.cursor_type = "row"
 
-        for anim in self._custom_animations:
-            custom_table.add_row(
-                anim.id,
-                anim.name,
-                anim.zone_id,
-                str(anim.fps),
-                str(anim.frame_count),
-            )
+        self._fill_custom_table(custom_table, self._custom_animations)
 
     def set_animations(self, animations: list[AnimationDef]) -> None:
-        """Update the custom animations list."""
+        """Update the custom animations list.
+
+        Rows for animations that are still present stay in place (their cells
+        are updated if the definition changed); only removed and appended
+        animations touch the table. A reorder or duplicate ids rebuild it.
+        """
+        previous = {anim.id: anim for anim in self._custom_animations}
         self._custom_animations = list(animations)
         custom_table = self.query_one("#ap-custom-table", DataTable)
-        custom_table.clear()
-        for anim in self._custom_animations:
-            custom_table.add_row(
-                anim.id,
-                anim.name,
-                anim.zone_id,
-                str(anim.fps),
-                str(anim.frame_count),
-            )
+
+        new_ids = [anim.id for anim in animations]
+        new_id_set = set(new_ids)
+        kept = [anim_id for anim_id in self._row_keys if anim_id in new_id_set]
+        if (
+            len(self._row_keys) != custom_table.row_count
+            or len(new_id_set) != len(new_ids)
+            or new_ids[: len(kept)] != kept
+        ):
+            self._fill_custom_table(custom_table, self._custom_animations)
+            return
+
+        for anim_id in [anim_id for anim_id in self._row_keys if anim_id not in new_id_set]:
+            custom_table.remove_row(self._row_keys.pop(anim_id))
+        for anim in animations[: len(kept)]:
+            if anim != previous[anim.id]:
+                row_key = self._row_keys[anim.id]
+                for column_key, value in zip(self._custom_columns, _custom_row(anim), strict=True):
+                    custom_table.update_cell(row_key, column_key, value)
+        added = animations[len(kept) :]
+        row_keys = custom_table.add_rows(_custom_row(anim) for anim in added)
+        self._row_keys.update(zip((anim.id for anim in added), row_keys, strict=True))
+
+    def _fill_custom_table(self, table: DataTable[Any], animations: list[AnimationDef]) -> None:
+        table.clear()
+        row_keys = table.add_rows(_custom_row(anim) for anim in animations)
+        self._row_keys = dict(zip((anim.id for anim in animations), row_keys, strict=True))
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Show preview when a row is clicked."""
@@ -171,11 +215,9 @@ class AnimationPicker(Widget):
             )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        match event.button.id:
-            case "ap-btn-select-builtin":
-                self._select_from_builtin()
-            case "ap-btn-select-custom":
-                self._select_from_custom()
+        handler = self._button_handlers.get(event.button.id or "")
+        if handler is not None:
+            handler()
 
     def _select_from_builtin(self) -> None:
         table = self.query_one("#ap-builtin-table", DataTable)
@@ -202,12 +244,4 @@ class AnimationPicker(Widget):
     @staticmethod
     def _get_pose_art(state: str) -> str:
         """Return a simple ASCII pose for the given state."""
-        poses = {
-            "idle": ("  O  \n /|\\ \n / \\ \n     \n~ relaxed stance ~"),
-            "typing": ("  O  \n /|\\ \n _||_\n / \\ \n~ fingers on keyboard ~"),
-            "reading": ("  O  \n /|] \n / \\ \n     \n~ holding a book ~"),
-            "drinking": ("  O  \n /|D \n / \\ \n     \n~ sipping coffee ~"),
-            "stretching": (" \\O/ \n  |  \n / \\ \n     \n~ arms up stretch ~"),
-            "looking_window": ("  O > \n /|\\  \n / \\  \n      \n~ gazing outside ~"),
-        }
-        return poses.get(state, "  O\n /|\\\n / \\\n~ unknown pose ~")
+        return _POSES.get(state, _DEFAULT_POSE)
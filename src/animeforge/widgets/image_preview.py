@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import struct
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from PIL import Image
 from textual.widget import Widget
@@ -12,7 +15,105 @@ from textual.widgets import Label, Static
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
-_BYTES_PER_UNIT = 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+@lru_cache(maxsize=64)
+def _box_rows(width: int) -> tuple[str, str]:
+    """Return the border and blank interior rows of a box *width* characters wide."""
+    return "+" + "-" * (width - 2) + "+", "|" + " " * (width - 2) + "|"
+
+
+@lru_cache(maxsize=128)
+def _make_placeholder(text: str) -> str:
+    """Return a fixed-size box with *text* centred in it."""
+    w, h = 40, 6
+    edge, blank = _box_rows(w)
+    lines = [blank] * h
+    lines[0] = lines[-1] = edge
+    lines[1 + (h - 2) // 2] = "|" + text.center(w - 2) + "|"
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=128)
+def _make_frame(img_w: int, img_h: int, label: str) -> str:
+    """Return a box scaled from the image size, labelled with its name and dimensions."""
+    # Scale to fit in terminal
+    canvas_w = min(60, max(20, img_w // 20))
+    canvas_h = min(12, max(4, img_h // 60))
+    inner = canvas_w - 2
+
+    edge, blank = _box_rows(canvas_w)
+    lines = [blank] * canvas_h
+    lines[0] = lines[-1] = edge
+    dim_row = 1 + (canvas_h - 2) // 2
+    lines[dim_row - 1] = "|" + label[:inner].center(inner) + "|"
+    lines[dim_row] = "|" + f"{img_w}x{img_h}".center(inner) + "|"
+    return "\n".join(lines)
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers (SOF0-SOF15 minus DHT, JPG and DAC), which carry the size.
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers with no length field: TEM, RST0-7, SOI, EOI.
+_JPEG_STANDALONE_MARKERS = frozenset((0x01, *range(0xD0, 0xDA)))
+
+
+def _header_dimensions(fp: BinaryIO) -> tuple[int, int] | None:
+    """Read PNG or baseline/progressive JPEG dimensions from the file header.
+
+    Returns ``None`` for any other format or a header that does not parse.
+    """
+    head = fp.read(24)
+    if head.startswith(_PNG_SIGNATURE) and head[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", head[16:24])
+        return width, height
+    if not head.startswith(b"\xff\xd8"):
+        return None
+
+    fp.seek(2)
+    while True:
+        byte = fp.read(1)
+        if byte != b"\xff":  # every segment must start at a marker; bail out to PIL
+            return None
+        while byte == b"\xff":  # fill bytes before the marker code
+            byte = fp.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+        segment = fp.read(2)
+        if len(segment) < 2:
+            return None
+        (length,) = struct.unpack(">H", segment)
+        if length < 2:  # the length counts its own two bytes
+            return None
+        if marker in _JPEG_SOF_MARKERS:
+            frame = fp.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            return width, height
+        fp.seek(length - 2, os.SEEK_CUR)
+
+
+@lru_cache(maxsize=256)
+def _image_dimensions(path: Path, mtime_ns: int, size: int) -> tuple[int, int] | None:
+    """Read image dimensions, from the PNG/JPEG header when possible, else via PIL.
+
+    *mtime_ns* and *size* are only part of the cache key, so a file that
+    changes on disk is re-read while re-previewing an unchanged one is free.
+    """
+    try:
+        with path.open("rb") as fp:
+            dims = _header_dimensions(fp)
+        if dims is not None:
+            return dims
+        with Image.open(path) as img:
+            return img.size
+    except Exception:  # noqa: BLE001
+        return None
 
 
 class ImagePreview(Widget):
@@ -60,6 +161,8 @@ class ImagePreview(Widget):
     ) -> None:
         super().__init__(name=name, id=id, classes=classes)
         self._image_path: Path | None = Path(image_path) if image_path else None
+        # (path, mtime_ns, size) of the file currently shown, to skip identical reloads.
+        self._shown: tuple[Path, int, int] | None = None
 
     def compose(self) -> ComposeResult:
         yield Static("Image Preview", classes="ip-title")
@@ -75,21 +178,29 @@ class ImagePreview(Widget):
     def load_image(self, path: str | Path) -> None:
         """Load and display image metadata."""
         self._image_path = Path(path).expanduser().resolve()
+        try:
+            st = self._image_path.stat()
+        except OSError:
+            st = None
+
+        shown = (self._image_path, st.st_mtime_ns, st.st_size) if st else None
+        if shown is not None and shown == self._shown:
+            return
+        self._shown = shown
+
         canvas = self.query_one("#ip-canvas", Static)
         info = self.query_one("#ip-info", Label)
-
-        if not self._image_path.exists():
-            canvas.update(self._make_placeholder("File not found"))
+        if st is None:
+            canvas.update(_make_placeholder("File not found"))
             info.update(f"Path: {self._image_path}")
             return
 
         # File info
-        size_bytes = self._image_path.stat().st_size
+        size_bytes = st.st_size
         size_str = self._format_size(size_bytes)
         suffix = self._image_path.suffix.lower()
 
-        # Try to get dimensions via PIL if available
-        dims = self._get_dimensions()
+        dims = _image_dimensions(self._image_path, st.st_mtime_ns, size_bytes)
         dims_str = f"{dims[0]}x{dims[1]}" if dims else "unknown"
 
         info.update(
@@ -101,72 +212,24 @@ class ImagePreview(Widget):
 
         # ASCII preview placeholder
         if dims:
-            canvas.update(self._make_frame(dims[0], dims[1], self._image_path.name))
+            canvas.update(_make_frame(dims[0], dims[1], self._image_path.name))
         else:
-            canvas.update(self._make_placeholder(self._image_path.name))
+            canvas.update(_make_placeholder(self._image_path.name))
 
     def clear(self) -> None:
         """Clear the preview."""
         self._image_path = None
+        self._shown = None
         self._show_placeholder()
 
     def _show_placeholder(self) -> None:
         canvas = self.query_one("#ip-canvas", Static)
         info = self.query_one("#ip-info", Label)
-        canvas.update(self._make_placeholder("No image loaded"))
+        canvas.update(_make_placeholder("No image loaded"))
         info.update("Drop an image path or use the import button.")
 
-    @staticmethod
-    def _make_placeholder(text: str) -> str:
-        w, h = 40, 6
-        top = "+" + "-" * (w - 2) + "+"
-        mid = "|" + " " * (w - 2) + "|"
-        label_line = "|" + text.center(w - 2) + "|"
-        bot = "+" + "-" * (w - 2) + "+"
-        lines = [top]
-        lines.extend(label_line if i == (h - 2) // 2 else mid for i in range(h - 2))
-        lines.append(bot)
-        return "\n".join(lines)
-
-    @staticmethod
-    def _make_frame(img_w: int, img_h: int, label: str) -> str:
-        # Scale to fit in terminal
-        canvas_w = min(60, max(20, img_w // 20))
-        canvas_h = min(12, max(4, img_h // 60))
-
-        top = "+" + "-" * (canvas_w - 2) + "+"
-        bot = "+" + "-" * (canvas_w - 2) + "+"
-        mid = "|" + " " * (canvas_w - 2) + "|"
-
-        dim_label = f"{img_w}x{img_h}"
-        name_line = "|" + label[: canvas_w - 2].center(canvas_w - 2) + "|"
-        dim_line = "|" + dim_label.center(canvas_w - 2) + "|"
-
-        lines = [top]
-        for i in range(canvas_h - 2):
-            if i == (canvas_h - 2) // 2 - 1:
-                lines.append(name_line)
-            elif i == (canvas_h - 2) // 2:
-                lines.append(dim_line)
-            else:
-                lines.append(mid)
-        lines.append(bot)
-        return "\n".join(lines)
-
-    def _get_dimensions(self) -> tuple[int, int] | None:
-        """Read image dimensions using PIL."""
-        if self._image_path is None or not self._image_path.exists():
-            return None
-        try:
-            with Image.open(self._image_path) as img:
-                return img.size
-        except Exception:  # noqa: BLE001
-            return None
-
     @staticmethod
     def _format_size(size_bytes: int) -> str:
-        for unit in ("B", "KB", "MB", "GB"):
-            if size_bytes < _BYTES_PER_UNIT:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= _BYTES_PER_UNIT  # type: ignore[assignment]
-        return f"{size_bytes:.1f} TB"
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly.
+        idx = min((max(size_bytes, 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
@@ -9,9 +9,14 @@ from textual.widget import Widget
 from textual.widgets import Label, ProgressBar, Static
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from textual.app import ComposeResult
+    from textual.timer import Timer
 
 _PROGRESS_COMPLETE = 100
+# Widget updates from bursts of set_progress() calls are applied at most this often.
+_FLUSH_INTERVAL = 0.05
 
 
 class _TaskEntry(Static):
@@ -45,25 +50,37 @@ class _TaskEntry(Static):
         super().__init__(id=f"te-{task_id}")
         self.task_id = task_id
         self._task_name = task_name
+        # Keep handles to the children so progress ticks skip the selector walk.
+        self._bar = ProgressBar(total=100, show_percentage=True, show_eta=False)
+        self._status_label = Label("Pending", classes="te-status")
+        self._status_text = "Pending"
+        self._shown: tuple[float, str] | None = None  # last (pct, status) drawn
 
     def compose(self) -> ComposeResult:
         yield Label(self._task_name, classes="te-name")
-        yield ProgressBar(total=100, show_percentage=True, show_eta=False)
-        yield Label("Pending", classes="te-status")
+        yield self._bar
+        yield self._status_label
 
     def set_progress(self, pct: float, status: str = "") -> None:
-        bar = self.query_one(ProgressBar)
-        bar.update(progress=pct)
-        status_label = self.query_one(".te-status", Label)
+        if (pct, status) == self._shown:
+            return
+        self._shown = (pct, status)
+        self._bar.update(progress=pct)
         if status:
-            status_label.update(status)
+            self._set_status_text(status)
         elif pct >= _PROGRESS_COMPLETE:
-            status_label.update("Done")
+            self._set_status_text("Done")
         elif pct > 0:
-            status_label.update(f"{pct:.0f}%")
+            self._set_status_text(f"{pct:.0f}%")
 
     def set_status(self, status: str) -> None:
-        self.query_one(".te-status", Label).update(status)
+        self._shown = None
+        self._set_status_text(status)
+
+    def _set_status_text(self, text: str) -> None:
+        if text != self._status_text:
+            self._status_text = text
+            self._status_label.update(text)
 
 
 class ProgressPanel(Widget):
@@ -127,6 +144,12 @@ class ProgressPanel(Widget):
         super().__init__(name=name, id=id, classes=classes)
         self._title = title
         self._tasks: dict[str, tuple[str, float]] = {}  # id -> (name, pct)
+        self._entries: dict[str, _TaskEntry] = {}
+        # Running totals over self._tasks so updates never rescan every task.
+        self._sum_pct = 0.0
+        self._completed_count = 0
+        self._pending: dict[str, tuple[float, str]] = {}  # id -> latest (pct, status)
+        self._flush_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Static(self._title, classes="pp-title")
@@ -135,60 +158,90 @@ class ProgressPanel(Widget):
             yield Label("Overall", classes="pp-overall-label")
             yield ProgressBar(total=100, show_percentage=True, show_eta=True, id="pp-overall-bar")
 
+    def on_mount(self) -> None:
+        self._overall = self.query_one(".pp-overall", Static)
+        self._overall_bar = self.query_one("#pp-overall-bar", ProgressBar)
+
     def add_task(self, task_id: str, task_name: str) -> None:
         """Add a new task to the panel."""
-        self._tasks[task_id] = (task_name, 0.0)
-        entry = _TaskEntry(task_id, task_name)
+        self.add_tasks([(task_id, task_name)])
+
+    def add_tasks(self, tasks: Iterable[tuple[str, str]]) -> None:
+        """Add several ``(task_id, task_name)`` tasks with a single mount."""
+        entries = []
+        for task_id, task_name in tasks:
+            if task_id in self._tasks:
+                self._account(self._tasks[task_id][1], 0.0)
+            self._tasks[task_id] = (task_name, 0.0)
+            entry = _TaskEntry(task_id, task_name)
+            self._entries[task_id] = entry
+            entries.append(entry)
         # Mount before the overall section
-        overall = self.query_one(".pp-overall", Static)
-        self.mount(entry, before=overall)
+        self.mount(*entries, before=self._overall)
 
     def set_progress(self, task_id: str, pct: float, status: str = "") -> None:
-        """Update a task's progress percentage."""
+        """Update a task's progress percentage.
+
+        Task state and completion messages are updated immediately; the
+        widgets are redrawn on the next flush so bursts collapse into one
+        update per task.
+        """
         if task_id not in self._tasks:
             return
 
         task_name, old_pct = self._tasks[task_id]
-        self._tasks[task_id] = (task_name, min(pct, 100.0))
+        new_pct = min(pct, 100.0)
+        if new_pct == old_pct and not status:
+            return
+        self._tasks[task_id] = (task_name, new_pct)
+        self._account(old_pct, new_pct)
 
-        entry = self.query_one(f"#te-{task_id}", _TaskEntry)
-        entry.set_progress(pct, status)
+        self._pending[task_id] = (pct, status)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(_FLUSH_INTERVAL, self._flush)
 
         if pct >= _PROGRESS_COMPLETE and old_pct < _PROGRESS_COMPLETE:
             self.post_message(self.TaskCompleted(task_id))
 
-        # Update overall
-        self._update_overall()
-
-        if all(p >= _PROGRESS_COMPLETE for _, p in self._tasks.values()):
+        if self._completed_count == len(self._tasks):
             self.post_message(self.AllCompleted())
 
+    def _account(self, old_pct: float, new_pct: float) -> None:
+        """Move one task's contribution to the running totals from old to new."""
+        self._sum_pct += new_pct - old_pct
+        self._completed_count += (new_pct >= _PROGRESS_COMPLETE) - (old_pct >= _PROGRESS_COMPLETE)
+
+    def _flush(self) -> None:
+        """Apply the latest buffered progress of each task to the widgets."""
+        self._flush_timer = None
+        pending, self._pending = self._pending, {}
+        for task_id, (pct, status) in pending.items():
+            self._entries[task_id].set_progress(pct, status)
+        self._update_overall()
+
     def _update_overall(self) -> None:
         if not self._tasks:
             return
-        total = sum(p for _, p in self._tasks.values())
-        overall_pct = total / len(self._tasks)
-        bar = self.query_one("#pp-overall-bar", ProgressBar)
-        bar.update(progress=overall_pct)
+        overall_pct = self._sum_pct / len(self._tasks)
+        self._overall_bar.update(progress=overall_pct)
 
     def reset(self) -> None:
         """Reset all tasks to 0%."""
+        self._pending.clear()
+        self._sum_pct = 0.0
+        self._completed_count = 0
         for task_id in self._tasks:
             self._tasks[task_id] = (self._tasks[task_id][0], 0.0)
-            try:
-                entry = self.query_one(f"#te-{task_id}", _TaskEntry)
-                entry.set_progress(0.0, "Pending")
-            except Exception:  # noqa: BLE001
-                pass
+            self._entries[task_id].set_progress(0.0, "Pending")
         self._update_overall()
 
     def clear_tasks(self) -> None:
         """Remove all tasks from the panel."""
-        for task_id in list(self._tasks):
-            try:
-                entry = self.query_one(f"#te-{task_id}", _TaskEntry)
-                entry.remove()
-            except Exception:  # noqa: BLE001
-                pass
+        self._pending.clear()
+        for entry in self._entries.values():
+            entry.remove()
+        self._entries.clear()
         self._tasks.clear()
+        self._sum_pct = 0.0
+        self._completed_count = 0
         self._update_overall()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from textual.widget import Widget
 from textual.widgets import Static
@@ -12,6 +12,32 @@ if TYPE_CHECKING:
 
     from animeforge.models import AnimationDef, StateTransition
 
+# Edge interior fill: blank cells become "-", cells already drawn become "+" crossings.
+_EDGE_FILL = bytes(ord("-") if b == ord(" ") else ord("+") for b in range(256))
+
+_LEGEND_HEADER = (
+    "[bold]Transitions:[/bold]",
+    "  -> : manual transition",
+    "  => : auto transition",
+    "  o  : self-loop",
+    "",
+)
+
+
+def _edge_label(from_sid: str, to_sid: str, duration: int, auto: bool) -> str:
+    suffix = f"({duration}ms){' [auto]' if auto else ''}"
+    if from_sid == to_sid:
+        return f"  o {from_sid} -> {to_sid} {suffix}"
+    arrow = "=>" if auto else "->"
+    return f"  {from_sid} {arrow} {to_sid} {suffix}"
+
+
+def _legend_text(drawn: list[tuple[str, str, int, bool]], n_states: int, n_trans: int) -> str:
+    """Format the legend for the edges drawn on the canvas, in drawing order."""
+    labels = (_edge_label(*edge) for edge in drawn) if drawn else ("  (no transitions defined)",)
+    footer = f"\n[dim]{n_states} states, {n_trans} transitions[/dim]"
+    return "\n".join((*_LEGEND_HEADER, *labels, footer))
+
 
 class StateGraph(Widget):
     """Visualize animation state machine as ASCII art.
@@ -60,6 +86,10 @@ class StateGraph(Widget):
         super().__init__(name=name, id=id, classes=classes)
         self._animations: list[AnimationDef] = list(animations or [])
         self._transitions: list[StateTransition] = list(transitions or [])
+        # Inputs of the last render; an identical key means the canvas is current.
+        self._last_key: tuple[Any, ...] | None = None
+        # Text currently shown by each Static, so identical writes can be skipped.
+        self._shown: dict[str | None, str] = {"sg-canvas": "", "sg-legend": ""}
 
     def compose(self) -> ComposeResult:
         yield Static("State Machine", classes="sg-title")
@@ -81,12 +111,22 @@ class StateGraph(Widget):
 
     def _render_graph(self) -> None:
         """Render the state graph as ASCII art."""
+        key = (
+            tuple((a.id, a.name) for a in self._animations),
+            tuple((t.from_state, t.to_state, t.duration_ms, t.auto) for t in self._transitions),
+        )
+        if key == self._last_key:
+            return
+        self._last_key = key
+
         canvas = self.query_one("#sg-canvas", Static)
         legend = self.query_one("#sg-legend", Static)
 
         if not self._animations:
-            canvas.update("[dim]No animations defined. Add animations in Character Studio.[/dim]")
-            legend.update("")
+            self._show(
+                canvas, "[dim]No animations defined. Add animations in Character Studio.[/dim]"
+            )
+            self._show(legend, "")
             return
 
         # Collect unique state IDs
@@ -108,40 +148,39 @@ class StateGraph(Widget):
         lines: list[str] = []
 
         # Row 1: Node boxes (top border)
-        row_top = ""
-        row_mid = ""
-        row_bot = ""
-
-        positions: dict[str, int] = {}  # state_id -> x center position
-
-        for i, sid in enumerate(state_ids):
-            x_start = i * (node_width + padding)
-            center = x_start + node_width // 2
-            positions[sid] = center
-
-            label = state_names[sid][: node_width - 2]
-            padded = label.center(node_width - 2)
-
-            row_top += "+" + "-" * (node_width - 2) + "+" + " " * padding
-            row_mid += "|" + padded + "|" + " " * padding
-            row_bot += "+" + "-" * (node_width - 2) + "+" + " " * padding
-
-        lines.append(row_top.rstrip())
+        gap = " " * padding
+        inner_width = node_width - 2
+        border = ("+" + "-" * inner_width + "+" + gap) * len(state_ids)
+        row_mid = "".join(
+            f"|{state_names[sid][:inner_width].center(inner_width)}|{gap}" for sid in state_ids
+        )
+
+        # state_id -> x center position
+        positions = {
+            sid: i * (node_width + padding) + node_width // 2 for i, sid in enumerate(state_ids)
+        }
+
+        lines.append(border.rstrip())
         lines.append(row_mid.rstrip())
-        lines.append(row_bot.rstrip())
+        lines.append(border.rstrip())
 
-        # Row 2: Connection indicators (arrows going down from nodes)
-        connector_row = [" "] * total_width
+        # Row 2: Connection indicators (arrows going down from nodes).
+        # The remaining rows are pure ASCII, so they are drawn into byte buffers.
+        connector_row = bytearray(b" " * total_width)
         for sid in state_ids:
             if edges.get(sid):
                 cx = positions[sid]
                 if cx < total_width:
-                    connector_row[cx] = "|"
-        lines.append("".join(connector_row).rstrip())
+                    connector_row[cx] = ord("|")
+        lines.append(connector_row.rstrip().decode("ascii"))
 
         # Row 3: Horizontal edges
-        edge_row = [" "] * total_width
-        edge_labels: list[str] = []
+        edge_row = bytearray(b" " * total_width)
+        drawn: list[tuple[str, str, int, bool]] = []  # labelled in the legend
+        # Each (start, end) span is drawn once however many transitions share it;
+        # arrow heads and self-loop marks are placed on top afterwards.
+        spans: dict[tuple[int, int], None] = {}
+        marks: dict[int, int] = {}  # x -> glyph
 
         for from_sid, targets in edges.items():
             for to_sid, duration, auto in targets:
@@ -150,67 +189,43 @@ class StateGraph(Widget):
 
                 x1 = positions[from_sid]
                 x2 = positions[to_sid]
+                drawn.append((from_sid, to_sid, duration, auto))
 
                 if x1 == x2:
                     # Self-loop indicator
-                    if x1 < total_width:
-                        edge_row[x1] = "o"
-                    edge_labels.append(
-                        f"  o {from_sid} -> {to_sid} ({duration}ms){' [auto]' if auto else ''}"
-                    )
+                    marks[x1] = ord("o")
                     continue
 
-                start = min(x1, x2)
-                end = max(x1, x2)
-
-                for x in range(start, end + 1):
-                    if x < total_width:
-                        if x in (start, end):
-                            edge_row[x] = "+"
-                        elif edge_row[x] == " ":
-                            edge_row[x] = "-"
-                        else:
-                            edge_row[x] = "+"
-
+                spans[min(x1, x2), max(x1, x2)] = None
                 # Arrow direction
-                if x2 > x1 and x2 < total_width:
-                    edge_row[x2] = ">"
-                elif x2 < x1 and x2 < total_width:
-                    edge_row[x2] = "<"
+                marks[x2] = ord(">") if x2 > x1 else ord("<")
 
-                arrow = "->" if not auto else "=>"
-                edge_labels.append(
-                    f"  {from_sid} {arrow} {to_sid} ({duration}ms){' [auto]' if auto else ''}"
-                )
+        for start, end in spans:
+            edge_row[start + 1 : end] = edge_row[start + 1 : end].translate(_EDGE_FILL)
+            edge_row[start] = edge_row[end] = ord("+")
+        for x, glyph in marks.items():
+            edge_row[x] = glyph
 
-        lines.append("".join(edge_row).rstrip())
+        lines.append(edge_row.rstrip().decode("ascii"))
 
         # Another connector row
-        connector_row2 = [" "] * total_width
+        connector_row2 = bytearray(b" " * total_width)
+        incoming = {to_sid for targets in edges.values() for to_sid, _, _ in targets}
         for sid in state_ids:
             cx = positions[sid]
-            if cx < total_width:
-                # Check if any edge points TO this node
-                is_target = any(
-                    to_sid == sid for targets in edges.values() for to_sid, _, _ in targets
-                )
-                if is_target:
-                    connector_row2[cx] = "v"
-        lines.append("".join(connector_row2).rstrip())
+            if cx < total_width and sid in incoming:
+                connector_row2[cx] = ord("v")
+        lines.append(connector_row2.rstrip().decode("ascii"))
 
         # Combine
         graph_text = "\n".join(lines)
-        canvas.update(graph_text)
-
-        # Legend
-        legend_parts = [
-            "[bold]Transitions:[/bold]",
-            "  -> : manual transition",
-            "  => : auto transition",
-            "  o  : self-loop",
-            "",
-        ]
-        legend_parts.extend(edge_labels if edge_labels else ["  (no transitions defined)"])
-        n_states, n_trans = len(state_ids), len(self._transitions)
-        legend_parts.append(f"\n[dim]{n_states} states, {n_trans} transitions[/dim]")
-        legend.update("\n".join(legend_parts))
+        self._show(canvas, graph_text)
+
+        self._show(legend, _legend_text(drawn, len(state_ids), len(self._transitions)))
+
+    def _show(self, static: Static, text: str) -> None:
+        """Update ``static`` unless it already shows ``text``."""
+        if self._shown.get(static.id) == text:
+            return
+        self._shown[static.id] = text
+        static.update(text)
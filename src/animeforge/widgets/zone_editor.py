@@ -13,7 +13,31 @@ from animeforge.models import Rect, Zone
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
-    from textual.widgets._data_table import RowKey
+    from textual.widgets._data_table import ColumnKey, RowKey
+
+# (input id, value shown when cleared), in table column order.
+_FIELD_DEFAULTS: tuple[tuple[str, str], ...] = (
+    ("ze-id", ""),
+    ("ze-name", ""),
+    ("ze-x", "0"),
+    ("ze-y", "0"),
+    ("ze-w", "200"),
+    ("ze-h", "200"),
+    ("ze-z", "1"),
+)
+
+
+def _zone_cells(zone: Zone) -> tuple[str, ...]:
+    """Format a zone as the cells of one editor-table row."""
+    return (
+        zone.id,
+        zone.name,
+        str(zone.bounds.x),
+        str(zone.bounds.y),
+        str(zone.bounds.width),
+        str(zone.bounds.height),
+        str(zone.z_index),
+    )
 
 
 class ZoneEditor(Widget):
@@ -80,6 +104,10 @@ class ZoneEditor(Widget):
         super().__init__(name=name, id=id, classes=classes)
         self._zones: list[Zone] = list(zones or [])
         self._editing_row_key: RowKey | None = None
+        # Row key and displayed cells for each entry of self._zones, index-aligned.
+        self._row_keys: list[RowKey] = []
+        self._row_cells: list[tuple[str, ...]] = []
+        self._columns: list[ColumnKey] = []
 
     def compose(self) -> ComposeResult:
         yield Static("Zone Editor", classes="ze-title")
@@ -116,8 +144,11 @@ class ZoneEditor(Widget):
 
     def on_mount(self) -> None:
         table = self.query_one("#ze-table", DataTable)
-        table.add_columns("ID", "Name", "X", "Y", "W", "H", "Z")
+        self._columns = table.add_columns("ID", "Name", "X", "Y", "W", "H", "Z")
         table.cursor_type = "row"
+        self._inputs = {
+            input_id: self.query_one(f"#{input_id}", Input) for input_id, _ in _FIELD_DEFAULTS
+        }
         self._sync_table()
 
     @property
@@ -130,42 +161,64 @@ class ZoneEditor(Widget):
         self._sync_table()
 
     def _sync_table(self) -> None:
-        """Repopulate the DataTable from internal zone list."""
+        """Bring the DataTable in line with the zone list.
+
+        Rows are matched to zones by position; only cells that differ are
+        updated, and rows are added or removed only at the end.
+        """
+        table = self.query_one("#ze-table", DataTable)
+        row_keys = self._row_keys
+        common = min(len(self._zones), len(row_keys))
+        for i in range(common):
+            self._update_row(i)
+        for row_key in row_keys[common:]:
+            table.remove_row(row_key)
+        del row_keys[common:], self._row_cells[common:]
+        for zone in self._zones[common:]:
+            self._append_row(zone)
+
+    def _append_row(self, zone: Zone) -> None:
+        cells = _zone_cells(zone)
+        table = self.query_one("#ze-table", DataTable)
+        self._row_keys.append(table.add_row(*cells))
+        self._row_cells.append(cells)
+
+    def _update_row(self, index: int) -> None:
+        """Rewrite only the cells of row ``index`` that differ from its zone."""
+        old = self._row_cells[index]
+        new = _zone_cells(self._zones[index])
+        if old == new:
+            return
         table = self.query_one("#ze-table", DataTable)
-        table.clear()
-        for zone in self._zones:
-            table.add_row(
-                zone.id,
-                zone.name,
-                str(zone.bounds.x),
-                str(zone.bounds.y),
-                str(zone.bounds.width),
-                str(zone.bounds.height),
-                str(zone.z_index),
-            )
+        row_key = self._row_keys[index]
+        for column_key, old_cell, new_cell in zip(self._columns, old, new, strict=True):
+            if old_cell != new_cell:
+                table.update_cell(row_key, column_key, new_cell)
+        self._row_cells[index] = new
 
     def _notify_changed(self) -> None:
         self.post_message(self.Changed(self.zones))
 
-    def _read_fields(self) -> tuple[str, str, float, float, float, float, int]:
-        return (
-            self.query_one("#ze-id", Input).value.strip(),
-            self.query_one("#ze-name", Input).value.strip(),
-            float(self.query_one("#ze-x", Input).value or 0),
-            float(self.query_one("#ze-y", Input).value or 0),
-            float(self.query_one("#ze-w", Input).value or 200),
-            float(self.query_one("#ze-h", Input).value or 200),
-            int(self.query_one("#ze-z", Input).value or 1),
+    def _read_zone(self) -> Zone | None:
+        """Build a zone from the input fields.
+
+        Returns ``None`` if the ID is blank or a number is malformed; the
+        name may be blank.
+        """
+        zid, zname, x, y, w, h, z = (
+            self._inputs[input_id].value.strip() or default for input_id, default in _FIELD_DEFAULTS
         )
+        if not zid:
+            return None
+        try:
+            bounds = Rect(x=float(x), y=float(y), width=float(w), height=float(h))
+            return Zone(id=zid, name=zname, bounds=bounds, z_index=int(z))
+        except ValueError:
+            return None
 
     def _clear_fields(self) -> None:
-        self.query_one("#ze-id", Input).value = ""
-        self.query_one("#ze-name", Input).value = ""
-        self.query_one("#ze-x", Input).value = "0"
-        self.query_one("#ze-y", Input).value = "0"
-        self.query_one("#ze-w", Input).value = "200"
-        self.query_one("#ze-h", Input).value = "200"
-        self.query_one("#ze-z", Input).value = "1"
+        for input_id, default in _FIELD_DEFAULTS:
+            self._inputs[input_id].value = default
         self._editing_row_key = None
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -182,51 +235,42 @@ class ZoneEditor(Widget):
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Populate fields when a row is selected."""
         cells = event.data_table.get_row(event.row_key)
-        self.query_one("#ze-id", Input).value = str(cells[0])
-        self.query_one("#ze-name", Input).value = str(cells[1])
-        self.query_one("#ze-x", Input).value = str(cells[2])
-        self.query_one("#ze-y", Input).value = str(cells[3])
-        self.query_one("#ze-w", Input).value = str(cells[4])
-        self.query_one("#ze-h", Input).value = str(cells[5])
-        self.query_one("#ze-z", Input).value = str(cells[6])
+        for (input_id, _), cell in zip(_FIELD_DEFAULTS, cells, strict=True):
+            self._inputs[input_id].value = str(cell)
         self._editing_row_key = event.row_key
 
     def _add_zone(self) -> None:
-        zid, zname, x, y, w, h, z = self._read_fields()
-        if not zid or not zname:
+        zone = self._read_zone()
+        if zone is None or not zone.name:
             return
 
-        zone = Zone(
-            id=zid,
-            name=zname,
-            bounds=Rect(x=x, y=y, width=w, height=h),
-            z_index=z,
-        )
         self._zones.append(zone)
-        self._sync_table()
+        self._append_row(zone)
         self._clear_fields()
         self._notify_changed()
 
     def _update_zone(self) -> None:
-        zid, zname, x, y, w, h, z = self._read_fields()
-        if not zid:
+        edited = self._read_zone()
+        if edited is None:
             return
 
         for i, zone in enumerate(self._zones):
-            if zone.id == zid:
-                self._zones[i] = Zone(
-                    id=zid,
-                    name=zname or zone.name,
-                    bounds=Rect(x=x, y=y, width=w, height=h),
-                    z_index=z,
+            if zone.id == edited.id:
+                # Keep the fields this form does not edit (animations, interactivity).
+                self._zones[i] = zone.model_copy(
+                    update={
+                        "name": edited.name or zone.name,
+                        "bounds": edited.bounds,
+                        "z_index": edited.z_index,
+                    }
                 )
+                self._update_row(i)
                 break
         else:
             # Not found — add as new
             self._add_zone()
             return
 
-        self._sync_table()
         self._clear_fields()
         self._notify_changed()
 
@@ -238,8 +282,13 @@ class ZoneEditor(Widget):
             row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
             cells = table.get_row(row_key)
             zone_id = str(cells[0])
-            self._zones = [z for z in self._zones if z.id != zone_id]
-            self._sync_table()
+            # Remove just the matching rows; the rows after them are left untouched.
+            keep = [i for i, zone in enumerate(self._zones) if zone.id != zone_id]
+            for i in set(range(len(self._zones))).difference(keep):
+                table.remove_row(self._row_keys[i])
+            self._zones = [self._zones[i] for i in keep]
+            self._row_keys = [self._row_keys[i] for i in keep]
+            self._row_cells = [self._row_cells[i] for i in keep]
             self._clear_fields()
             self._notify_changed()
         except Exception:  # noqa: BLE001
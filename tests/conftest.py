@@ -3,7 +3,10 @@
 from pathlib import Path
 
 import pytest
+from PIL import Image
+from pydantic import BaseModel
 
+from animeforge import models
 from animeforge.models import (
     AnimationDef,
     Character,
@@ -17,8 +20,33 @@ from animeforge.models import (
 from animeforge.models.enums import Season, TimeOfDay, Weather
 
 
-@pytest.fixture
-def sample_scene() -> Scene:
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (image rasterization and encoding)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Build the deferred model schemas up front so no single test pays for them."""
+    for name in models.__all__:
+        obj = getattr(models, name)
+        if isinstance(obj, type) and issubclass(obj, BaseModel):
+            obj.model_rebuild()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def _sample_scene() -> Scene:
     return Scene(
         name="cozy-study",
         description="cozy anime study room, warm lighting, bookshelves",
@@ -40,8 +68,7 @@ def sample_scene() -> Scene:
     )
 
 
-@pytest.fixture
-def sample_character() -> Character:
+def _sample_character() -> Character:
     return Character(
         name="Study Girl",
         description="anime girl with headphones, brown hair, cozy sweater",
@@ -62,6 +89,16 @@ def sample_character() -> Character:
     )
 
 
+@pytest.fixture
+def sample_scene() -> Scene:
+    return _sample_scene()
+
+
+@pytest.fixture
+def sample_character() -> Character:
+    return _sample_character()
+
+
 @pytest.fixture
 def sample_project(sample_scene: Scene, sample_character: Character) -> Project:
     return Project(
@@ -71,6 +108,16 @@ def sample_project(sample_scene: Scene, sample_character: Character) -> Project:
     )
 
 
+@pytest.fixture(scope="module")
+def module_sample_project() -> Project:
+    """Same data as ``sample_project``, built once per test module. Copy before mutating."""
+    return Project(
+        name="test-project",
+        scene=_sample_scene(),
+        character=_sample_character(),
+    )
+
+
 @pytest.fixture
 def sample_export_config(tmp_path: Path) -> ExportConfig:
     return ExportConfig(
@@ -81,3 +128,15 @@ def sample_export_config(tmp_path: Path) -> ExportConfig:
         weathers=[Weather.CLEAR],
         seasons=[Season.SUMMER],
     )
+
+
+@pytest.fixture(scope="session")
+def synthetic_frames(tmp_path_factory: pytest.TempPathFactory) -> list[Path]:
+    """Five 64x64 RGBA PNG frames, written once per session. Treat as read-only."""
+    frames_dir = tmp_path_factory.mktemp("synthetic_frames")
+    frames = []
+    for i in range(5):
+        path = frames_dir / f"f{i}.png"
+        Image.new("RGBA", (64, 64), (255, 0, 0, 128)).save(path, "PNG")
+        frames.append(path)
+    return frames
@@ -79,14 +79,14 @@ class TestExportAnimatedImage:
             output_path=output,
             animated_format="gif",
         )
-        img = Image.open(output)
         count = 0
-        try:
-            while True:
-                count += 1
-                img.seek(img.tell() + 1)
-        except EOFError:
-            pass
+        with Image.open(output) as img:
+            try:
+                while True:
+                    count += 1
+                    img.seek(img.tell() + 1)
+            except EOFError:
+                pass
         assert count == 4
 
     def test_apng_has_correct_frame_count(self, tmp_path: Path) -> None:
@@ -99,14 +99,14 @@ class TestExportAnimatedImage:
             output_path=output,
             animated_format="apng",
         )
-        img = Image.open(output)
         count = 0
-        try:
-            while True:
-                count += 1
-                img.seek(img.tell() + 1)
-        except EOFError:
-            pass
+        with Image.open(output) as img:
+            try:
+                while True:
+                    count += 1
+                    img.seek(img.tell() + 1)
+            except EOFError:
+                pass
         assert count == 4
 
     def test_gif_frame_duration(self, tmp_path: Path) -> None:
@@ -119,8 +119,8 @@ class TestExportAnimatedImage:
             output_path=output,
             animated_format="gif",
         )
-        img = Image.open(output)
-        duration = img.info.get("duration", 0)
+        with Image.open(output) as img:
+            duration = img.info.get("duration", 0)
         assert duration == 100
 
     def test_corrupt_sprite_sheet_raises(self, tmp_path: Path) -> None:
@@ -219,8 +219,8 @@ class TestExportAnimatedImage:
         )
         assert result == output
         assert output.exists()
-        img = Image.open(output)
-        assert img.format == "GIF"
+        with Image.open(output) as img:
+            assert img.format == "GIF"
 
 
 class TestExportProjectAnimated:
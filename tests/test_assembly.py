@@ -29,29 +29,29 @@ def _make_frame(
 # --- assemble_sprite_sheet tests ---
 
 
-def test_assemble_horizontal_layout(tmp_path):
-    """Multiple frames assembled side-by-side: width = n * fw, height = fh."""
-    frames = [_make_frame(tmp_path, f"f{i}.png", color=(i * 60, 0, 0, 255)) for i in range(4)]
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    ("direction", "n_frames", "expected_size"),
+    [
+        ("horizontal", 4, (64 * 4, 64)),
+        ("vertical", 3, (64, 64 * 3)),
+        ("horizontal", 1, (64, 64)),
+    ],
+)
+def test_assemble_layout(tmp_path, synthetic_frames, direction, n_frames, expected_size):
+    """Frames are laid out along ``direction``; a single frame matches frame_size."""
     output = tmp_path / "sheet.png"
-    result = assemble_sprite_sheet(frames, output, frame_size=(64, 64), direction="horizontal")
+    result = assemble_sprite_sheet(
+        synthetic_frames[:n_frames], output, frame_size=(64, 64), direction=direction
+    )
 
     assert result == output
-    assert output.exists()
-    sheet = Image.open(output)
-    assert sheet.size == (64 * 4, 64)
-    assert sheet.mode == "RGBA"
-
-
-def test_assemble_vertical_layout(tmp_path):
-    """Frames stacked vertically: width = fw, height = n * fh."""
-    frames = [_make_frame(tmp_path, f"f{i}.png") for i in range(3)]
-    output = tmp_path / "sheet_v.png"
-    assemble_sprite_sheet(frames, output, frame_size=(64, 64), direction="vertical")
-
-    sheet = Image.open(output)
-    assert sheet.size == (64, 64 * 3)
+    with Image.open(output) as sheet:
+        assert sheet.size == expected_size
+        assert sheet.mode == "RGBA"
 
 
+@pytest.mark.slow
 def test_assemble_with_padding(tmp_path):
     """Padding between frames creates transparent gaps."""
     frames = [_make_frame(tmp_path, f"f{i}.png", color=(255, 0, 0, 255)) for i in range(3)]
@@ -59,26 +59,15 @@ def test_assemble_with_padding(tmp_path):
     padding = 10
     assemble_sprite_sheet(frames, output, frame_size=(64, 64), padding=padding)
 
-    sheet = Image.open(output)
     expected_width = 64 * 3 + padding * 2
-    assert sheet.size == (expected_width, 64)
-
     # Pixel in the gap between frame 0 and frame 1 should be transparent.
     gap_x = 64 + padding // 2  # midpoint of first gap
-    pixel = sheet.getpixel((gap_x, 32))
+    with Image.open(output) as sheet:
+        assert sheet.size == (expected_width, 64)
+        pixel = sheet.getpixel((gap_x, 32))
     assert pixel[3] == 0, f"Padding pixel should be transparent, got alpha={pixel[3]}"
 
 
-def test_assemble_single_frame(tmp_path):
-    """Single frame: output matches frame_size exactly."""
-    frame = _make_frame(tmp_path, "single.png")
-    output = tmp_path / "sheet_single.png"
-    assemble_sprite_sheet([frame], output, frame_size=(64, 64))
-
-    sheet = Image.open(output)
-    assert sheet.size == (64, 64)
-
-
 def test_assemble_empty_frames_raises(tmp_path):
     """Empty frame list raises ValueError."""
     output = tmp_path / "sheet_empty.png"
@@ -86,19 +75,21 @@ def test_assemble_empty_frames_raises(tmp_path):
         assemble_sprite_sheet([], output, frame_size=(64, 64))
 
 
+@pytest.mark.slow
 def test_assemble_resizes_mismatched_frames(tmp_path):
     """Frames larger than frame_size are resized to match."""
     frames = [_make_frame(tmp_path, f"big{i}.png", size=(128, 128)) for i in range(2)]
     output = tmp_path / "sheet_resize.png"
     assemble_sprite_sheet(frames, output, frame_size=(64, 64))
 
-    sheet = Image.open(output)
-    assert sheet.size == (64 * 2, 64)
+    with Image.open(output) as sheet:
+        assert sheet.size == (64 * 2, 64)
 
 
-def test_assemble_returns_output_path(tmp_path):
+@pytest.mark.slow
+def test_assemble_returns_output_path(tmp_path, synthetic_frames):
     """Return value is the output path passed in."""
-    frame = _make_frame(tmp_path, "f.png")
+    frame = synthetic_frames[0]
     output = tmp_path / "sub" / "sheet.png"
     result = assemble_sprite_sheet([frame], output, frame_size=(64, 64))
     assert result == output
@@ -116,8 +107,8 @@ def test_optimize_png_preserves_alpha(tmp_path):
 
     assert result == dst
     assert dst.exists()
-    img = Image.open(dst)
-    assert img.mode == "RGBA"
+    with Image.open(dst) as img:
+        assert img.mode == "RGBA"
 
 
 def test_optimize_jpeg_drops_alpha(tmp_path):
@@ -126,25 +117,25 @@ def test_optimize_jpeg_drops_alpha(tmp_path):
     dst = tmp_path / "opt.jpg"
     optimize_image(src, dst, img_format="JPEG", quality=80)
 
-    img = Image.open(dst)
-    assert img.mode == "RGB"
+    with Image.open(dst) as img:
+        assert img.mode == "RGB"
 
 
-def test_optimize_webp_output(tmp_path):
+def test_optimize_webp_output(tmp_path, synthetic_frames):
     """WEBP output creates a valid file."""
-    src = _make_frame(tmp_path, "src.png")
+    src = synthetic_frames[0]
     dst = tmp_path / "opt.webp"
     result = optimize_image(src, dst, img_format="WEBP", quality=90)
 
     assert result == dst
     assert dst.exists()
-    img = Image.open(dst)
-    assert img.size == (64, 64)
+    with Image.open(dst) as img:
+        assert img.size == (64, 64)
 
 
-def test_optimize_returns_output_path(tmp_path):
+def test_optimize_returns_output_path(tmp_path, synthetic_frames):
     """Return value is the output_path for chaining."""
-    src = _make_frame(tmp_path, "src.png")
+    src = synthetic_frames[0]
     dst = tmp_path / "out" / "result.webp"
     result = optimize_image(src, dst, img_format="WEBP")
     assert result == dst
@@ -214,12 +214,12 @@ async def test_sprite_sheet_dimensions(
         output_dir=tmp_path / "sheet_output",
     )
 
-    sheet = Image.open(results["idle"])
     frame_count = test_character.animations[0].frame_count
     expected_width = config.generation.width * frame_count
     expected_height = config.generation.height
 
-    assert sheet.size == (expected_width, expected_height)
+    with Image.open(results["idle"]) as sheet:
+        assert sheet.size == (expected_width, expected_height)
 
 
 async def test_sprite_sheet_is_rgba(
@@ -240,8 +240,8 @@ async def test_sprite_sheet_is_rgba(
         output_dir=tmp_path / "rgba_output",
     )
 
-    sheet = Image.open(results["idle"])
-    assert sheet.mode == "RGBA"
+    with Image.open(results["idle"]) as sheet:
+        assert sheet.mode == "RGBA"
 
 
 # --- IP-Adapter consistency parameters ---
@@ -160,8 +160,8 @@ def test_generate_with_custom_dimensions(tmp_path):
     # Verify actual image dimensions
     from PIL import Image
 
-    img = Image.open(png_files[0])
-    assert img.size == (128, 96)
+    with Image.open(png_files[0]) as img:
+        assert img.size == (128, 96)
 
 
 def test_generate_unavailable_backend(tmp_path):
@@ -6,18 +6,19 @@ from pydantic import ValidationError
 from animeforge.config import AppConfig, ComfyUISettings, GenerationSettings, ModelSettings
 
 
-def test_comfyui_settings_defaults():
-    s = ComfyUISettings()
+@pytest.mark.parametrize(
+    ("use_ssl", "base_url", "ws_url"),
+    [
+        (False, "http://127.0.0.1:8188", "ws://127.0.0.1:8188/ws"),
+        (True, "https://127.0.0.1:8188", "wss://127.0.0.1:8188/ws"),
+    ],
+)
+def test_comfyui_settings_urls(use_ssl: bool, base_url: str, ws_url: str) -> None:
+    s = ComfyUISettings(use_ssl=use_ssl)
     assert s.host == "127.0.0.1"
     assert s.port == 8188
-    assert s.base_url == "http://127.0.0.1:8188"
-    assert s.ws_url == "ws://127.0.0.1:8188/ws"
-
-
-def test_comfyui_settings_ssl():
-    s = ComfyUISettings(use_ssl=True)
-    assert s.base_url == "https://127.0.0.1:8188"
-    assert s.ws_url == "wss://127.0.0.1:8188/ws"
+    assert s.base_url == base_url
+    assert s.ws_url == ws_url
 
 
 def test_model_settings_defaults():
@@ -5,10 +5,12 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
 from animeforge.cli import app
 from animeforge.models import ExportConfig, Project, Scene
+from animeforge.models.enums import TimeOfDay
 from animeforge.pipeline.export import (
     RUNTIME_JS_FILENAME,
     SCENE_LOADER_JS_FILENAME,
@@ -17,6 +19,19 @@ from animeforge.pipeline.export import (
 
 runner = CliRunner()
 
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent / "src" / "animeforge"
+
+
+def _hide_paths(*paths: Path):
+    """Patch ``Path.exists`` to report ``paths`` as missing."""
+    hidden = frozenset(map(str, paths))
+    original_exists = Path.exists
+
+    def patched_exists(self: Path) -> bool:
+        return str(self) not in hidden and original_exists(self)
+
+    return patch.object(Path, "exists", patched_exists)
+
 
 # ---------------------------------------------------------------------------
 # Pipeline-level tests (validate_export)
@@ -34,41 +49,28 @@ class TestValidateExport:
         assert any("Runtime JS" in lbl for lbl in labels)
         assert any("Templates" in lbl for lbl in labels)
 
-    def test_missing_runtime_js(self, sample_project: Project, sample_export_config: ExportConfig):
-        runtime_dir = Path(__file__).resolve().parent.parent / "src" / "animeforge" / "runtime"
-        runtime_path = runtime_dir / RUNTIME_JS_FILENAME
-
-        original_exists = Path.exists
-
-        def patched_exists(self: Path) -> bool:
-            if self == runtime_path:
-                return False
-            return original_exists(self)
-
-        with patch.object(Path, "exists", patched_exists):
-            result = validate_export(sample_project, sample_export_config)
-        assert not result.valid
-        js_check = next(c for c in result.checks if "Runtime JS" in c.label)
-        assert not js_check.passed
-        assert RUNTIME_JS_FILENAME in js_check.message
-
-    def test_missing_template(self, sample_project: Project, sample_export_config: ExportConfig):
-        template_dir = Path(__file__).resolve().parent.parent / "src" / "animeforge" / "templates"
-        template_path = template_dir / "index.html.jinja2"
-
-        original_exists = Path.exists
-
-        def patched_exists(self: Path) -> bool:
-            if self == template_path:
-                return False
-            return original_exists(self)
-
-        with patch.object(Path, "exists", patched_exists):
+    @pytest.mark.parametrize(
+        ("subdir", "filename", "label"),
+        [
+            ("runtime", RUNTIME_JS_FILENAME, "Runtime JS"),
+            ("runtime", SCENE_LOADER_JS_FILENAME, "Runtime JS"),
+            ("templates", "index.html.jinja2", "Templates"),
+        ],
+    )
+    def test_missing_packaged_file(
+        self,
+        sample_project: Project,
+        sample_export_config: ExportConfig,
+        subdir: str,
+        filename: str,
+        label: str,
+    ):
+        with _hide_paths(_PACKAGE_DIR / subdir / filename):
             result = validate_export(sample_project, sample_export_config)
         assert not result.valid
-        tpl_check = next(c for c in result.checks if "Templates" in c.label)
-        assert not tpl_check.passed
-        assert "index.html.jinja2" in tpl_check.message
+        check = next(c for c in result.checks if label in c.label)
+        assert not check.passed
+        assert filename in check.message
 
     def test_no_character(self, sample_export_config: ExportConfig):
         project = Project(
@@ -108,8 +110,6 @@ class TestValidateExport:
         self, sample_project: Project, sample_export_config: ExportConfig, tmp_path: Path
     ):
         """Project with time_variants and sprite sheets counted correctly."""
-        from animeforge.models.enums import TimeOfDay
-
         # Add time_variants to a layer
         sample_project.scene.layers[0].time_variants = {
             TimeOfDay.DAY: tmp_path / "day.png",
@@ -129,46 +129,29 @@ class TestValidateExport:
 # ---------------------------------------------------------------------------
 
 
-class TestExportDryRunCLI:
-    def test_exit_code_zero(self, sample_project: Project, tmp_path: Path):
-        project_file = sample_project.save(tmp_path / "project.json")
-        result = runner.invoke(app, ["export", str(project_file), "--dry-run"])
-        assert result.exit_code == 0
-        assert "Dry run: export validation" in result.output
-        assert "Export would write to:" in result.output
-        assert "Estimated files:" in result.output
+@pytest.fixture(scope="module")
+def project_file(module_sample_project: Project, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """The sample project saved once for the CLI tests, which only read it."""
+    return module_sample_project.save(tmp_path_factory.mktemp("dry_run") / "project.json")
+
 
-    def test_no_files_written(self, sample_project: Project, tmp_path: Path):
+class TestExportDryRunCLI:
+    def test_reports_without_writing(self, project_file: Path, tmp_path: Path):
         out_dir = tmp_path / "should_not_exist"
-        project_file = sample_project.save(tmp_path / "project.json")
         result = runner.invoke(
             app,
             ["export", str(project_file), "--output", str(out_dir), "--dry-run"],
         )
         assert result.exit_code == 0
+        assert "Dry run: export validation" in result.output
+        assert "Export would write to:" in result.output
+        assert "Estimated files:" in result.output
+        assert "\u2713" in result.output
         assert not out_dir.exists()
 
-    def test_missing_js_exit_code_one(self, sample_project: Project, tmp_path: Path):
-        project_file = sample_project.save(tmp_path / "project.json")
-
-        runtime_dir = Path(__file__).resolve().parent.parent / "src" / "animeforge" / "runtime"
-        runtime_path = runtime_dir / RUNTIME_JS_FILENAME
-        loader_path = runtime_dir / SCENE_LOADER_JS_FILENAME
-
-        original_exists = Path.exists
-
-        def patched_exists(self: Path) -> bool:
-            if self in (runtime_path, loader_path):
-                return False
-            return original_exists(self)
-
-        with patch.object(Path, "exists", patched_exists):
+    def test_missing_js_exit_code_one(self, project_file: Path):
+        runtime_dir = _PACKAGE_DIR / "runtime"
+        with _hide_paths(runtime_dir / RUNTIME_JS_FILENAME, runtime_dir / SCENE_LOADER_JS_FILENAME):
             result = runner.invoke(app, ["export", str(project_file), "--dry-run"])
         assert result.exit_code == 1
         assert "\u2717" in result.output
-
-    def test_check_marks_in_output(self, sample_project: Project, tmp_path: Path):
-        project_file = sample_project.save(tmp_path / "project.json")
-        result = runner.invoke(app, ["export", str(project_file), "--dry-run"])
-        assert result.exit_code == 0
-        assert "\u2713" in result.output
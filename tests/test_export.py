@@ -1,13 +1,15 @@
 """Tests for the export pipeline."""
 
+import io
 import json
 from pathlib import Path
 
 import jinja2
 import pytest
+from PIL import Image
 
 from animeforge.models import ExportConfig, Project
-from animeforge.models.enums import EffectType
+from animeforge.models.enums import EffectType, Season, TimeOfDay, Weather
 from animeforge.models.scene import EffectDef
 from animeforge.pipeline import export as export_module
 from animeforge.pipeline.export import (
@@ -21,51 +23,68 @@ from animeforge.pipeline.export import (
 )
 
 
-@pytest.fixture
-def _populated_project(sample_project: Project, tmp_path: Path) -> Project:
-    """Create a project with a fake background image for export."""
-    from PIL import Image
+def _encode_background() -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (16, 9), (100, 120, 200)).save(buf, format="PNG")
+    return buf.getvalue()
 
-    bg_dir = tmp_path / "backgrounds"
+
+# Scene dimensions come from the project, not the image, so a tiny PNG encoded once will do.
+_BG_PNG_BYTES = _encode_background()
+
+
+def _add_background(project: Project, root: Path) -> Project:
+    """Write a fake background image under ``root`` and wire it into the first layer."""
+    bg_dir = root / "backgrounds"
     bg_dir.mkdir()
 
     # Create a fake background image and wire it into the layer
-    from animeforge.models.enums import TimeOfDay
-
-    img = Image.new("RGB", (1920, 1080), (100, 120, 200))
     bg_path = bg_dir / "bg_day.png"
-    img.save(bg_path)
+    bg_path.write_bytes(_BG_PNG_BYTES)
 
-    if sample_project.scene.layers:
-        sample_project.scene.layers[0].time_variants[TimeOfDay.DAY] = bg_path
+    if project.scene.layers:
+        project.scene.layers[0].time_variants[TimeOfDay.DAY] = bg_path
 
-    sample_project.project_dir = tmp_path
-    return sample_project
+    project.project_dir = root
+    return project
 
 
-def test_export_creates_output_dir(_populated_project: Project, tmp_path: Path):
-    config = ExportConfig(output_dir=tmp_path / "export_out", image_format="png")
-    summary = export_project(_populated_project, config)
-    out = summary.output_dir
+@pytest.fixture
+def _populated_project(sample_project: Project, tmp_path: Path) -> Project:
+    """Create a project with a fake background image for export."""
+    return _add_background(sample_project, tmp_path)
+
+
+@pytest.fixture(scope="module")
+def _exported(
+    module_sample_project: Project, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Project, Path]:
+    """Export a populated project once and share the (project, output dir) across tests."""
+    root = tmp_path_factory.mktemp("export")
+    project = _add_background(module_sample_project.model_copy(deep=True), root)
+    config = ExportConfig(output_dir=root / "export_out", image_format="png")
+    return project, export_project(project, config).output_dir
+
+
+def test_export_creates_output_dir(_exported: tuple[Project, Path]):
+    project, out = _exported
     assert out.exists()
     assert out.is_dir()
 
 
-def test_export_creates_scene_json(_populated_project: Project, tmp_path: Path):
-    config = ExportConfig(output_dir=tmp_path / "export_out", image_format="png")
-    summary = export_project(_populated_project, config)
-    out = summary.output_dir
+def test_export_creates_scene_json(_exported: tuple[Project, Path]):
+    project, out = _exported
     scene_json = out / "scene.json"
     assert scene_json.exists()
 
     data = json.loads(scene_json.read_text(encoding="utf-8"))
     # Top-level backward-compat keys
-    assert data["name"] == _populated_project.scene.name
+    assert data["name"] == project.scene.name
     assert data["width"] == 1920
     assert data["height"] == 1080
     assert "default_season" in data
     # New runtime-expected keys
-    assert data["meta"]["name"] == _populated_project.scene.name
+    assert data["meta"]["name"] == project.scene.name
     assert data["meta"]["width"] == 1920
     assert data["meta"]["height"] == 1080
     assert isinstance(data["layers"], list)
@@ -77,10 +96,8 @@ def test_export_creates_scene_json(_populated_project: Project, tmp_path: Path):
     assert data["initial"]["animation"] == "idle"
 
 
-def test_export_creates_index_html(_populated_project: Project, tmp_path: Path):
-    config = ExportConfig(output_dir=tmp_path / "export_out", image_format="png")
-    summary = export_project(_populated_project, config)
-    out = summary.output_dir
+def test_export_creates_index_html(_exported: tuple[Project, Path]):
+    project, out = _exported
     index = out / "index.html"
     assert index.exists()
 
@@ -90,10 +107,8 @@ def test_export_creates_index_html(_populated_project: Project, tmp_path: Path):
     assert "animeforge-runtime.js" in content
 
 
-def test_export_copies_runtime_js(_populated_project: Project, tmp_path: Path):
-    config = ExportConfig(output_dir=tmp_path / "export_out", image_format="png")
-    summary = export_project(_populated_project, config)
-    out = summary.output_dir
+def test_export_copies_runtime_js(_exported: tuple[Project, Path]):
+    project, out = _exported
 
     runtime_js = out / "animeforge-runtime.js"
     scene_loader = out / "scene-loader.js"
@@ -104,18 +119,14 @@ def test_export_copies_runtime_js(_populated_project: Project, tmp_path: Path):
     assert scene_loader.stat().st_size > 0
 
 
-def test_export_creates_backgrounds_dir(_populated_project: Project, tmp_path: Path):
-    config = ExportConfig(output_dir=tmp_path / "export_out", image_format="png")
-    summary = export_project(_populated_project, config)
-    out = summary.output_dir
+def test_export_creates_backgrounds_dir(_exported: tuple[Project, Path]):
+    project, out = _exported
     bg_dir = out / "backgrounds"
     assert bg_dir.exists()
 
 
-def test_export_scene_json_has_zones(_populated_project: Project, tmp_path: Path):
-    config = ExportConfig(output_dir=tmp_path / "export_out", image_format="png")
-    summary = export_project(_populated_project, config)
-    out = summary.output_dir
+def test_export_scene_json_has_zones(_exported: tuple[Project, Path]):
+    project, out = _exported
     data = json.loads((out / "scene.json").read_text(encoding="utf-8"))
     assert len(data["zones"]) == 1
     zone = data["zones"][0]
@@ -148,26 +159,34 @@ def test_export_raises_on_corrupt_sprite_sheet(
         export_project(sample_project, config)
 
 
+class _CSSFailingEnv(jinja2.Environment):
+    """Environment whose scene.css.jinja2 lookup raises ``css_error``."""
+
+    css_error: Exception
+
+    def get_template(self, name, *a, **kw):
+        if name == "scene.css.jinja2":
+            raise self.css_error
+        return super().get_template(name, *a, **kw)
+
+
+def _css_template_raises(error: Exception) -> type[jinja2.Environment]:
+    return type("_CSSFailingEnv", (_CSSFailingEnv,), {"css_error": error})
+
+
 def test_css_template_syntax_error_propagates(
     _populated_project: Project,
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
 ):
     """TemplateSyntaxError in scene.css.jinja2 must NOT be silently swallowed."""
-    original_env_class = export_module.Environment
-
-    class _BadCSSEnv(original_env_class):
-        def get_template(self, name, *a, **kw):
-            if name == "scene.css.jinja2":
-                raise jinja2.TemplateSyntaxError(
-                    message="unexpected '{'",
-                    lineno=1,
-                    name=name,
-                    filename=name,
-                )
-            return super().get_template(name, *a, **kw)
-
-    monkeypatch.setattr(export_module, "Environment", _BadCSSEnv)
+    error = jinja2.TemplateSyntaxError(
+        message="unexpected '{'",
+        lineno=1,
+        name="scene.css.jinja2",
+        filename="scene.css.jinja2",
+    )
+    monkeypatch.setattr(export_module, "Environment", _css_template_raises(error))
 
     config = ExportConfig(output_dir=tmp_path / "export_out", image_format="png")
     with pytest.raises(jinja2.TemplateSyntaxError):
@@ -181,8 +200,6 @@ def test_css_template_syntax_error_propagates(
 
 def test_generate_preview_writes_jpeg(tmp_path: Path):
     """Happy path: a valid PNG in bg_dir produces a preview.jpg."""
-    from PIL import Image
-
     bg_dir = tmp_path / "backgrounds"
     bg_dir.mkdir()
     out_dir = tmp_path / "out"
@@ -195,10 +212,8 @@ def test_generate_preview_writes_jpeg(tmp_path: Path):
 
     preview = out_dir / "preview.jpg"
     assert preview.exists()
-    assert preview.stat().st_size > 0
-
-    result = Image.open(preview)
-    assert result.format == "JPEG"
+    # JPEG SOI marker followed by the first segment marker.
+    assert preview.read_bytes()[:3] == b"\xff\xd8\xff"
 
 
 def test_generate_preview_no_candidates(tmp_path: Path):
@@ -238,15 +253,8 @@ def test_export_css_template_not_found_fallback(
     monkeypatch: pytest.MonkeyPatch,
 ):
     """TemplateNotFound for scene.css.jinja2 should trigger _fallback_css()."""
-    original_env_class = export_module.Environment
-
-    class _MissingCSSEnv(original_env_class):
-        def get_template(self, name, *a, **kw):
-            if name == "scene.css.jinja2":
-                raise jinja2.TemplateNotFound("scene.css.jinja2")
-            return super().get_template(name, *a, **kw)
-
-    monkeypatch.setattr(export_module, "Environment", _MissingCSSEnv)
+    error = jinja2.TemplateNotFound("scene.css.jinja2")
+    monkeypatch.setattr(export_module, "Environment", _css_template_raises(error))
 
     config = ExportConfig(output_dir=tmp_path / "export_out", image_format="png")
     summary = export_project(_populated_project, config)
@@ -425,8 +433,6 @@ def test_export_with_effect_sprite_sheet(
     sample_project: Project, tmp_path: Path
 ) -> None:
     """Effect with a valid sprite_sheet on disk gets copied to output."""
-    from PIL import Image
-
     sprite = Image.new("RGBA", (128, 32), (200, 200, 255, 180))
     sprite_path = tmp_path / "rain_sprite.png"
     sprite.save(sprite_path)
@@ -444,10 +450,6 @@ def test_export_effect_with_weather_and_season_triggers(
     sample_project: Project, tmp_path: Path
 ) -> None:
     """Effect with weather/season triggers includes them in scene.json."""
-    from PIL import Image
-
-    from animeforge.models.enums import Season, Weather
-
     sprite = Image.new("RGBA", (64, 64), (255, 255, 255, 128))
     sprite_path = tmp_path / "snow.png"
     sprite.save(sprite_path)
@@ -479,8 +481,6 @@ def test_export_background_source_missing_warning(
     sample_project: Project, tmp_path: Path
 ) -> None:
     """Layer with a time_variant pointing to a non-existent file logs a warning."""
-    from animeforge.models.enums import TimeOfDay
-
     # Point to a file that doesn't exist
     nonexistent = tmp_path / "missing_bg.png"
     sample_project.scene.layers[0].time_variants[TimeOfDay.DAY] = nonexistent
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -52,58 +53,65 @@ async def test_is_available_with_api_key_network_error(tmp_path: Path) -> None:
 # ── Endpoint selection ───────────────────────────────────────────
 
 
-class TestEndpointSelection:
-    """Test _select_endpoint routing logic."""
-
-    def setup_method(self) -> None:
-        self.settings = FalSettings(
+@pytest.fixture(scope="module")
+def endpoint_backend() -> FalBackend:
+    """Backend with one distinct endpoint per routing case; shared, never connected."""
+    return FalBackend(
+        FalSettings(
             default_model="fal-ai/pony-v7",
             controlnet_model="fal-ai/sdxl-controlnet-union",
             ip_adapter_model="fal-ai/ip-adapter-face-id",
         )
-        self.backend = FalBackend(self.settings)
-
-    def test_default_endpoint(self) -> None:
-        """Plain text-to-image uses the default model."""
-        request = GenerationRequest(prompt="anime girl studying")
-        assert self.backend._select_endpoint(request) == "fal-ai/pony-v7"
-
-    def test_controlnet_endpoint(self) -> None:
-        """ControlNet request routes to controlnet model."""
-        request = GenerationRequest(
-            prompt="anime girl",
-            controlnet_image=Path("/tmp/pose.png"),
-            controlnet_model="openpose",
-        )
-        assert self.backend._select_endpoint(request) == "fal-ai/sdxl-controlnet-union"
+    )
 
-    def test_ip_adapter_endpoint(self) -> None:
-        """IP-Adapter request routes to IP-Adapter model."""
-        request = GenerationRequest(
-            prompt="anime girl",
-            ip_adapter_image=Path("/tmp/face.png"),
-        )
-        assert self.backend._select_endpoint(request) == "fal-ai/ip-adapter-face-id"
-
-    def test_controlnet_takes_priority_over_ip_adapter(self) -> None:
-        """When both ControlNet and IP-Adapter are set, ControlNet wins."""
-        request = GenerationRequest(
-            prompt="anime girl",
-            controlnet_image=Path("/tmp/pose.png"),
-            controlnet_model="openpose",
-            ip_adapter_image=Path("/tmp/face.png"),
-        )
-        assert self.backend._select_endpoint(request) == "fal-ai/sdxl-controlnet-union"
+
+@pytest.mark.parametrize(
+    ("request_kwargs", "expected"),
+    [
+        # Plain text-to-image uses the default model.
+        ({}, "fal-ai/pony-v7"),
+        # ControlNet request routes to controlnet model.
+        (
+            {"controlnet_image": Path("/tmp/pose.png"), "controlnet_model": "openpose"},
+            "fal-ai/sdxl-controlnet-union",
+        ),
+        # IP-Adapter request routes to IP-Adapter model.
+        ({"ip_adapter_image": Path("/tmp/face.png")}, "fal-ai/ip-adapter-face-id"),
+        # When both ControlNet and IP-Adapter are set, ControlNet wins.
+        (
+            {
+                "controlnet_image": Path("/tmp/pose.png"),
+                "controlnet_model": "openpose",
+                "ip_adapter_image": Path("/tmp/face.png"),
+            },
+            "fal-ai/sdxl-controlnet-union",
+        ),
+    ],
+    ids=["default", "controlnet", "ip_adapter", "controlnet_over_ip_adapter"],
+)
+def test_select_endpoint(
+    endpoint_backend: FalBackend, request_kwargs: dict[str, Any], expected: str
+) -> None:
+    """_select_endpoint routes each request type to its configured model."""
+    request = GenerationRequest(prompt="anime girl", **request_kwargs)
+    assert endpoint_backend._select_endpoint(request) == expected
 
 
 # ── Parameter building ───────────────────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def fal_backend() -> FalBackend:
+    """Default-settings backend shared by the _build_params tests.
+
+    Those tests only read settings; any ``patch.object`` or ``monkeypatch`` on it is undone.
+    """
+    return FalBackend(FalSettings())
+
+
 @pytest.mark.asyncio
-async def test_build_params_basic() -> None:
+async def test_build_params_basic(fal_backend: FalBackend) -> None:
     """Basic request maps to correct API params."""
-    settings = FalSettings()
-    backend = FalBackend(settings)
     request = GenerationRequest(
         prompt="cozy study room",
         negative_prompt="ugly, blurry",
@@ -114,7 +122,7 @@ async def test_build_params_basic() -> None:
         seed=42,
         batch_size=2,
     )
-    params = await backend._build_params(request)
+    params = await fal_backend._build_params(request)
 
     assert params["prompt"] == "cozy study room"
     assert params["negative_prompt"] == "ugly, blurry"
@@ -126,38 +134,37 @@ async def test_build_params_basic() -> None:
 
 
 @pytest.mark.asyncio
-async def test_build_params_no_negative_prompt() -> None:
+async def test_build_params_no_negative_prompt(fal_backend: FalBackend) -> None:
     """Negative prompt is omitted when empty."""
-    settings = FalSettings()
-    backend = FalBackend(settings)
     request = GenerationRequest(prompt="anime", negative_prompt="")
-    params = await backend._build_params(request)
+    params = await fal_backend._build_params(request)
     assert "negative_prompt" not in params
 
 
 @pytest.mark.asyncio
-async def test_build_params_random_seed() -> None:
+async def test_build_params_random_seed(fal_backend: FalBackend) -> None:
     """Seed -1 (random) should not be included in params."""
-    settings = FalSettings()
-    backend = FalBackend(settings)
     request = GenerationRequest(prompt="anime", seed=-1)
-    params = await backend._build_params(request)
+    params = await fal_backend._build_params(request)
     assert "seed" not in params
 
 
 @pytest.mark.asyncio
-async def test_build_params_img2img() -> None:
+async def test_build_params_img2img(
+    fal_backend: FalBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """img2img sets image and strength params."""
-    settings = FalSettings()
-    backend = FalBackend(settings)
+
+    async def fake_upload(path: Path) -> str:
+        return "https://cdn.fal.ai/uploaded.png"
+
     request = GenerationRequest(
         prompt="anime",
         init_image=Path("/tmp/init.png"),
         denoise_strength=0.6,
     )
-    with patch.object(backend, "_prepare_image_url", new_callable=AsyncMock) as mock_upload:
-        mock_upload.return_value = "https://cdn.fal.ai/uploaded.png"
-        params = await backend._build_params(request)
+    monkeypatch.setattr(fal_backend, "_prepare_image_url", fake_upload)
+    params = await fal_backend._build_params(request)
 
     assert params["image"] == "https://cdn.fal.ai/uploaded.png"
     assert params["strength"] == 0.6
@@ -305,19 +312,17 @@ async def test_is_available_returns_true_on_422(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_build_params_controlnet() -> None:
+async def test_build_params_controlnet(fal_backend: FalBackend) -> None:
     """ControlNet request includes control_image and conditioning_scale."""
-    settings = FalSettings()
-    backend = FalBackend(settings)
     request = GenerationRequest(
         prompt="anime",
         controlnet_image=Path("/tmp/pose.png"),
         controlnet_model="openpose",
         controlnet_strength=0.8,
     )
-    with patch.object(backend, "_prepare_image_url", new_callable=AsyncMock) as mock_upload:
+    with patch.object(fal_backend, "_prepare_image_url", new_callable=AsyncMock) as mock_upload:
         mock_upload.return_value = "https://cdn.fal.ai/pose.png"
-        params = await backend._build_params(request)
+        params = await fal_backend._build_params(request)
 
     assert params["control_image"] == "https://cdn.fal.ai/pose.png"
     assert params["controlnet_conditioning_scale"] == 0.8
@@ -325,18 +330,16 @@ async def test_build_params_controlnet() -> None:
 
 
 @pytest.mark.asyncio
-async def test_build_params_ip_adapter() -> None:
+async def test_build_params_ip_adapter(fal_backend: FalBackend) -> None:
     """IP-Adapter request includes face_image and ip_adapter_scale."""
-    settings = FalSettings()
-    backend = FalBackend(settings)
     request = GenerationRequest(
         prompt="anime",
         ip_adapter_image=Path("/tmp/face.png"),
         ip_adapter_weight=0.6,
     )
-    with patch.object(backend, "_prepare_image_url", new_callable=AsyncMock) as mock_upload:
+    with patch.object(fal_backend, "_prepare_image_url", new_callable=AsyncMock) as mock_upload:
         mock_upload.return_value = "https://cdn.fal.ai/face.png"
-        params = await backend._build_params(request)
+        params = await fal_backend._build_params(request)
 
     assert params["face_image"] == "https://cdn.fal.ai/face.png"
     assert params["ip_adapter_scale"] == 0.6
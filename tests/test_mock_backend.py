@@ -1,14 +1,19 @@
 """Tests for MockBackend."""
 
+import asyncio
+
 import pytest
 
 from animeforge.backend.base import GenerationBackend, GenerationRequest
 from animeforge.backend.mock import MockBackend
 
 
-@pytest.fixture
-def mock_backend(tmp_path):
-    return MockBackend(output_dir=tmp_path / "mock_output")
+@pytest.fixture(scope="module")
+def mock_backend(tmp_path_factory):
+    """One connected backend shared by the module; generate() only adds files."""
+    backend = MockBackend(output_dir=tmp_path_factory.mktemp("mock_output"))
+    asyncio.run(backend.connect())
+    return backend
 
 
 @pytest.mark.asyncio
@@ -18,10 +23,11 @@ async def test_protocol_compliance():
 
 
 @pytest.mark.asyncio
-async def test_is_available(mock_backend):
-    await mock_backend.connect()
-    assert await mock_backend.is_available() is True
-    await mock_backend.disconnect()
+async def test_is_available(tmp_path):
+    backend = MockBackend(output_dir=tmp_path / "mock_output")
+    await backend.connect()
+    assert await backend.is_available() is True
+    await backend.disconnect()
 
 
 @pytest.mark.asyncio
@@ -32,7 +38,6 @@ async def test_get_models(mock_backend):
 
 @pytest.mark.asyncio
 async def test_generate_creates_image(mock_backend):
-    await mock_backend.connect()
     request = GenerationRequest(
         prompt="cozy anime room",
         width=256,
@@ -44,20 +49,19 @@ async def test_generate_creates_image(mock_backend):
     assert result.prompt == "cozy anime room"
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_generate_image_dimensions(mock_backend):
     from PIL import Image
 
-    await mock_backend.connect()
     request = GenerationRequest(prompt="test", width=512, height=384)
     result = await mock_backend.generate(request)
-    img = Image.open(result.images[0])
-    assert img.size == (512, 384)
+    with Image.open(result.images[0]) as img:
+        assert img.size == (512, 384)
 
 
 @pytest.mark.asyncio
 async def test_generate_deterministic_seed(mock_backend):
-    await mock_backend.connect()
     request = GenerationRequest(prompt="same prompt", seed=42, width=64, height=64)
     r1 = await mock_backend.generate(request)
     r2 = await mock_backend.generate(request)
@@ -66,7 +70,6 @@ async def test_generate_deterministic_seed(mock_backend):
 
 @pytest.mark.asyncio
 async def test_generate_negative_seed_is_deterministic(mock_backend):
-    await mock_backend.connect()
     req1 = GenerationRequest(prompt="hello", seed=-1, width=64, height=64)
     req2 = GenerationRequest(prompt="hello", seed=-1, width=64, height=64)
     r1 = await mock_backend.generate(req1)
@@ -76,7 +79,6 @@ async def test_generate_negative_seed_is_deterministic(mock_backend):
 
 @pytest.mark.asyncio
 async def test_progress_callback(mock_backend):
-    await mock_backend.connect()
     steps_received = []
 
     def on_progress(step, total, status):
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -106,6 +105,21 @@ def test_scene_with_layers():
     assert len(scene.zones) == 1
 
 
+def test_scene_base_layer():
+    assert Scene(name="empty").base_layer is None
+    assert Scene(name="single", layers=[Layer(id="only", z_index=3)]).base_layer.id == "only"  # type: ignore[union-attr]
+    scene = Scene(
+        name="unordered",
+        layers=[
+            Layer(id="fg", z_index=10),
+            Layer(id="bg", z_index=-1),
+            Layer(id="mid", z_index=5),
+        ],
+    )
+    assert scene.base_layer is not None
+    assert scene.base_layer.id == "bg"
+
+
 def test_animation_def():
     anim = AnimationDef(
         id="typing",
@@ -170,35 +184,33 @@ def test_scene_json_serialization():
             ),
         ],
     )
-    data = json.loads(scene.model_dump_json())
+    data = scene.model_dump(mode="json")
     assert data["name"] == "test"
     assert len(data["layers"]) == 1
     assert data["zones"][0]["bounds"]["x"] == 10
 
 
-def test_project_save_load():
-    scene = Scene(name="test-scene")
-    project = Project(name="test-project", scene=scene)
+@pytest.fixture(scope="module")
+def saved_full_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project with a character, saved once per module. Treat as read-only."""
+    scene = Scene(name="scene")
+    char = Character(name="Girl", description="anime girl")
+    project = Project(name="full", scene=scene, character=char)
+    return project.save(tmp_path_factory.mktemp("proj"))
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        save_path = project.save(Path(tmpdir))
-        assert save_path.exists()
 
-        loaded = Project.load(Path(tmpdir))
-        assert loaded.name == "test-project"
-        assert loaded.scene.name == "test-scene"
+def test_project_save_load(saved_full_project: Path):
+    assert saved_full_project.exists()
 
+    loaded = Project.load(saved_full_project.parent)
+    assert loaded.name == "full"
+    assert loaded.scene.name == "scene"
 
-def test_project_with_character():
-    scene = Scene(name="scene")
-    char = Character(name="Girl", description="anime girl")
-    project = Project(name="full", scene=scene, character=char)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project.save(Path(tmpdir))
-        loaded = Project.load(Path(tmpdir))
-        assert loaded.character is not None
-        assert loaded.character.name == "Girl"
+def test_project_with_character(saved_full_project: Path):
+    loaded = Project.load(saved_full_project)
+    assert loaded.character is not None
+    assert loaded.character.name == "Girl"
 
 
 def test_project_load_file_not_found():
@@ -206,20 +218,18 @@ def test_project_load_file_not_found():
         Project.load(Path("/nonexistent/path/project.json"))
 
 
-def test_project_load_invalid_json():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        bad_file = Path(tmpdir) / "project.json"
-        bad_file.write_text("{not valid json!!", encoding="utf-8")
-        with pytest.raises(ProjectLoadError, match="project file contains invalid JSON"):
-            Project.load(bad_file)
+def test_project_load_invalid_json(tmp_path: Path):
+    bad_file = tmp_path / "project.json"
+    bad_file.write_text("{not valid json!!", encoding="utf-8")
+    with pytest.raises(ProjectLoadError, match="project file contains invalid JSON"):
+        Project.load(bad_file)
 
 
-def test_project_load_schema_mismatch():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        bad_file = Path(tmpdir) / "project.json"
-        bad_file.write_text(json.dumps({"unexpected": "data"}), encoding="utf-8")
-        with pytest.raises(ProjectLoadError, match="project file has invalid structure"):
-            Project.load(bad_file)
+def test_project_load_schema_mismatch(tmp_path: Path):
+    bad_file = tmp_path / "project.json"
+    bad_file.write_text(json.dumps({"unexpected": "data"}), encoding="utf-8")
+    with pytest.raises(ProjectLoadError, match="project file has invalid structure"):
+        Project.load(bad_file)
 
 
 @pytest.mark.parametrize("bad", [0, -1, 101, 200])
@@ -386,10 +396,9 @@ class TestProjectLoadErrorPaths:
         with pytest.raises(ProjectLoadError, match="project file not found"):
             Project.load(Path("/tmp/absolutely-does-not-exist-animeforge"))
 
-    def test_load_empty_file_content(self):
+    def test_load_empty_file_content(self, tmp_path: Path):
         """Loading a file with empty content raises ProjectLoadError (invalid JSON)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            empty_file = Path(tmpdir) / "project.json"
-            empty_file.write_text("", encoding="utf-8")
-            with pytest.raises(ProjectLoadError, match="project file contains invalid JSON"):
-                Project.load(empty_file)
+        empty_file = tmp_path / "project.json"
+        empty_file.write_text("", encoding="utf-8")
+        with pytest.raises(ProjectLoadError, match="project file contains invalid JSON"):
+            Project.load(empty_file)
@@ -1,6 +1,5 @@
 """Tests for pipeline modules."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -89,53 +88,30 @@ def test_interpolate_poses_same_count():
     assert len(result) == original_count
 
 
-def test_generate_rain_sprites():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = generate_rain_sprites(Path(tmpdir))
-        assert path.exists()
-        assert path.suffix == ".png"
-
-
-def test_generate_snow_sprites():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = generate_snow_sprites(Path(tmpdir))
-        assert path.exists()
-        assert path.suffix == ".png"
-
-
-def test_generate_leaf_sprites():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = generate_leaf_sprites(Path(tmpdir))
-        assert path.exists()
-        assert path.suffix == ".png"
-
-
-def test_generate_sakura_sprites():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = generate_sakura_sprites(Path(tmpdir))
-        assert path.exists()
-        assert path.suffix == ".png"
-
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "generate",
+    [generate_rain_sprites, generate_snow_sprites, generate_leaf_sprites, generate_sakura_sprites],
+    ids=["rain", "snow", "leaf", "sakura"],
+)
+def test_generate_effect_sprites(generate, tmp_path: Path):
+    path = generate(tmp_path)
+    assert path.exists()
+    assert path.suffix == ".png"
 
-def test_generate_sakura_sprites_dimensions():
-    from PIL import Image as PILImage
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = generate_sakura_sprites(Path(tmpdir), frame_count=6, frame_width=64, frame_height=64)
-        img = PILImage.open(path)
+@pytest.mark.slow
+def test_generate_sakura_sprites_dimensions(tmp_path: Path):
+    path = generate_sakura_sprites(tmp_path, frame_count=6, frame_width=64, frame_height=64)
+    with Image.open(path) as img:
         assert img.size == (64 * 6, 64)
 
 
-def _make_valid_frame(path: Path, size: tuple[int, int] = (32, 32)) -> None:
-    """Create a small valid RGBA PNG at *path*."""
-    img = Image.new("RGBA", size, (255, 0, 0, 255))
-    img.save(path, "PNG")
-
-
-def test_assemble_sprite_sheet_zero_byte_raises_assembly_error(tmp_path: Path):
-    good = tmp_path / "frame0.png"
+def test_assemble_sprite_sheet_zero_byte_raises_assembly_error(
+    tmp_path: Path, synthetic_frames: list[Path]
+):
+    good = synthetic_frames[0]
     bad = tmp_path / "frame1.png"
-    _make_valid_frame(good)
     bad.write_bytes(b"")
 
     with pytest.raises(AssemblyError, match="Frame 1"):
@@ -180,6 +156,7 @@ def test_interpolate_poses_single_source_frame():
         assert frame_kp.nose == pytest.approx([0.3, 0.2, 1.0])
 
 
+@pytest.mark.slow
 def test_render_pose_image_creates_file(tmp_path: Path):
     from PIL import Image as PILImage
 
@@ -189,16 +166,17 @@ def test_render_pose_image_creates_file(tmp_path: Path):
     assert returned == out
     assert out.exists()
     assert out.suffix == ".png"
-    img = PILImage.open(out)
-    img.load()
-    assert img.format == "PNG"
+    with PILImage.open(out) as img:
+        img.load()
+        assert img.format == "PNG"
 
 
+@pytest.mark.slow
 def test_render_pose_image_dimensions(tmp_path: Path):
     from PIL import Image as PILImage
 
     kp = PoseKeypoints()
     out = tmp_path / "pose.png"
     render_pose_image(kp, out, width=256, height=128)
-    img = PILImage.open(out)
-    assert img.size == (256, 128)
+    with PILImage.open(out) as img:
+        assert img.size == (256, 128)
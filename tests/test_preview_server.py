@@ -7,18 +7,34 @@ import urllib.request
 import pytest
 import websockets
 
+from animeforge.backend.mock import MockBackend
 from animeforge.preview_server import PreviewServer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def server():
-    """Create a PreviewServer with test ports."""
+    """One PreviewServer with test ports, shared by the sync tests in this module."""
     return PreviewServer(http_port=0, ws_port=0)
 
 
+@pytest.fixture(scope="module")
+def http_port(server):
+    """Start the shared server's HTTP thread once and return its bound port."""
+    server._start_http_server()
+    yield server._http_server.server_address[1]
+    server._http_server.shutdown()
+    server._http_server.server_close()
+
+
 class TestProgressCallback:
     """Tests for the progress callback factory."""
 
+    @pytest.fixture(autouse=True)
+    def _drain_queue(self, server):
+        yield
+        while not server._queue.empty():
+            server._queue.get_nowait()
+
     def test_progress_callback_queues_message(self, server):
         callback = server._make_progress_callback()
         callback(3, 10, "generating step 3")
@@ -40,29 +56,19 @@ class TestProgressCallback:
 class TestHTTPHandler:
     """Tests for the HTTP server serving preview.html."""
 
-    def test_http_serves_html(self, server):
-        server._start_http_server()
-        try:
-            port = server._http_server.server_address[1]
-            with urllib.request.urlopen(f"http://localhost:{port}") as resp:
-                body = resp.read().decode()
-                assert resp.status == 200
-                assert "<canvas" in body
-                assert "AnimeForge Preview" in body
-        finally:
-            server._http_server.shutdown()
-
-    def test_http_404_for_other_paths(self, server):
-        server._start_http_server()
+    def test_http_serves_html(self, http_port):
+        with urllib.request.urlopen(f"http://localhost:{http_port}") as resp:
+            body = resp.read().decode()
+            assert resp.status == 200
+            assert "<canvas" in body
+            assert "AnimeForge Preview" in body
+
+    def test_http_404_for_other_paths(self, http_port):
         try:
-            port = server._http_server.server_address[1]
-            try:
-                urllib.request.urlopen(f"http://localhost:{port}/nonexistent")
-                pytest.fail("Expected HTTPError")
-            except urllib.error.HTTPError as e:
-                assert e.code == 404
-        finally:
-            server._http_server.shutdown()
+            urllib.request.urlopen(f"http://localhost:{http_port}/nonexistent")
+            pytest.fail("Expected HTTPError")
+        except urllib.error.HTTPError as e:
+            assert e.code == 404
 
 
 class TestWebSocketBroadcast:
@@ -72,11 +78,12 @@ class TestWebSocketBroadcast:
     async def test_broadcast_delivers_to_client(self):
         server = PreviewServer(http_port=0, ws_port=0)
 
-        async with websockets.serve(server._ws_handler, "localhost", 0) as ws_server:
+        async with websockets.serve(
+            server._ws_handler, "localhost", 0, compression=None
+        ) as ws_server:
             port = ws_server.sockets[0].getsockname()[1]
-            async with websockets.connect(f"ws://localhost:{port}") as client:
-                # Small delay to let handler register the client
-                await asyncio.sleep(0.05)
+            async with websockets.connect(f"ws://localhost:{port}", compression=None) as client:
+                await asyncio.wait_for(server._client_connected.wait(), timeout=2.0)
                 await server.broadcast(
                     {"type": "progress", "step": 1, "total": 10, "status": "test"}
                 )
@@ -90,13 +97,20 @@ class TestFullGenerationFlow:
     """Tests for end-to-end generation through the preview server."""
 
     @pytest.mark.asyncio
-    async def test_generation_streams_progress_and_complete(self):
+    async def test_generation_streams_progress_and_complete(self, monkeypatch, tmp_path):
+        # No per-step delay, and keep the generated image out of the home directory.
+        monkeypatch.setattr(
+            "animeforge.preview_server.MockBackend",
+            lambda: MockBackend(output_dir=tmp_path, step_delay=0),
+        )
         server = PreviewServer(http_port=0, ws_port=0)
 
-        async with websockets.serve(server._ws_handler, "localhost", 0) as ws_server:
+        async with websockets.serve(
+            server._ws_handler, "localhost", 0, compression=None
+        ) as ws_server:
             port = ws_server.sockets[0].getsockname()[1]
-            async with websockets.connect(f"ws://localhost:{port}") as client:
-                await asyncio.sleep(0.05)
+            async with websockets.connect(f"ws://localhost:{port}", compression=None) as client:
+                await asyncio.wait_for(server._client_connected.wait(), timeout=2.0)
 
                 broadcaster = asyncio.create_task(server._broadcast_loop())
                 generation = asyncio.create_task(server._run_generation("test prompt"))
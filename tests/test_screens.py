@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import pytest
 from textual.widgets import Button, DataTable, Input, Label, ProgressBar, RichLog, Select
 
 from animeforge.app import AnimeForgeApp
 from animeforge.widgets import ProgressPanel
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 # ---------------------------------------------------------------------------
 # 0. current_project property
 # ---------------------------------------------------------------------------
@@ -171,6 +177,137 @@ async def test_settings_has_action_buttons() -> None:
         assert screen.query_one("#btn-back", Button) is not None
 
 
+async def test_settings_reset_then_save_writes_defaults(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Reset Defaults followed by Save writes the default values to config.toml."""
+    import tomllib
+
+    from animeforge.config import AppConfig
+    from animeforge.screens import settings_screen
+
+    monkeypatch.setattr(settings_screen, "load_config", lambda: AppConfig(config_dir=tmp_path))
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.navigate("settings")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen.query_one("#gen-steps", Input).value = "99"
+        screen._reset_defaults()
+        screen.query_one("#gen-seed", Input).value = "42"
+        screen._save_settings()
+
+    data = tomllib.loads((tmp_path / "config.toml").read_text(encoding="utf-8"))
+    defaults = AppConfig()
+    assert data["active_backend"] == defaults.active_backend
+    assert data["comfyui"]["port"] == defaults.comfyui.port
+    assert data["generation"]["steps"] == defaults.generation.steps
+    assert data["generation"]["seed"] == 42
+
+
+async def test_settings_save_creates_missing_config_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Saving into a config directory that does not exist yet creates it."""
+    from animeforge.config import AppConfig
+    from animeforge.screens import settings_screen
+
+    config_dir = tmp_path / "nested" / "animeforge"
+    monkeypatch.setattr(settings_screen, "load_config", lambda: AppConfig(config_dir=config_dir))
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.navigate("settings")
+        await pilot.pause()
+        pilot.app.screen._save_settings()
+
+    assert (config_dir / "config.toml").is_file()
+
+
+@pytest.mark.parametrize(
+    ("field", "message"),
+    [
+        ("#comfy-port", "Invalid Port — must be an integer."),
+        ("#gen-cfg", "Invalid CFG Scale — must be a number."),
+        ("#gen-seed", "Invalid Seed — must be an integer."),
+    ],
+)
+async def test_settings_save_rejects_bad_numbers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, field: str, message: str
+) -> None:
+    """A non-numeric numeric field blocks the save and names the field."""
+    from animeforge.config import AppConfig
+    from animeforge.screens import settings_screen
+
+    monkeypatch.setattr(settings_screen, "load_config", lambda: AppConfig(config_dir=tmp_path))
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.navigate("settings")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen.query_one(field, Input).value = "abc"
+        screen._save_settings()
+        assert str(screen.query_one("#settings-status", Label).renderable) == message
+    assert not (tmp_path / "config.toml").exists()
+
+
+def test_settings_toml_fallback_writer_round_trips(tmp_path: Path) -> None:
+    """The fallback TOML writer emits booleans, numbers and strings tomllib reads back."""
+    import tomllib
+
+    from animeforge.screens.settings_screen import SettingsScreen
+
+    data = {
+        "active_backend": "mock",
+        "comfyui": {"host": "localhost", "port": 8188, "use_ssl": False},
+        "generation": {"cfg_scale": 7.5, "sampler": "euler", "seed": -1},
+    }
+    path = tmp_path / "config.toml"
+    SettingsScreen._write_toml_fallback(path, data)
+
+    assert tomllib.loads(path.read_text(encoding="utf-8")) == data
+
+
+async def test_settings_test_connection_reuses_client_and_debounces() -> None:
+    """Connection tests share one pooled client, and rapid repeat presses are ignored."""
+    import httpx
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.navigate("settings")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        screen._http_client = client
+        screen.query_one("#active-backend", Select).value = "comfyui"
+        screen._test_connection()
+        screen._test_connection()
+        await pilot.app.workers.wait_for_complete()
+        assert len(requests) == 1
+        assert (
+            "connected to comfyui"
+            in str(screen.query_one("#settings-status", Label).renderable).lower()
+        )
+
+        screen._last_test_at -= 60
+        screen._test_connection()
+        await pilot.app.workers.wait_for_complete()
+        assert len(requests) == 2
+        assert screen._client() is client
+
+        pilot.app.pop_screen()
+        await pilot.pause()
+    assert client.is_closed
+
+
 # ---------------------------------------------------------------------------
 # 4. Scene Editor
 # ---------------------------------------------------------------------------
@@ -330,6 +467,59 @@ async def test_generation_has_log_and_controls() -> None:
         assert screen.query_one("#btn-clear-log", Button) is not None
 
 
+async def test_generation_runs_enabled_phases_and_skips_unchecked(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Generation runs checked phases with MockBackend and logs unchecked ones as skipped."""
+    from textual.widgets import Checkbox
+
+    from animeforge.config import AppConfig
+    from animeforge.models import Layer, Project, Scene
+    from animeforge.screens import generation
+
+    monkeypatch.setattr(generation, "load_config", lambda: AppConfig(active_backend="mock"))
+    proj = Project(
+        name="Gen",
+        scene=Scene(name="S", width=64, height=64, layers=[Layer(id="bg", z_index=0)]),
+        project_dir=tmp_path,
+    )
+
+    app = AnimeForgeApp()
+    async with app.run_test() as pilot:
+        pilot.app.current_project = proj
+        pilot.app.navigate("generation")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen.query_one("#phase-char", Checkbox).value = False
+        screen.query_one("#phase-fx", Checkbox).value = False
+        screen.action_start_generation()
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        lines = [line.text for line in screen.query_one("#gen-log", RichLog).lines]
+
+    assert "Completed: Background layers (4 variants)" in lines
+    assert "Skipped: Character sprites (unchecked)" in lines
+    assert "Skipped: Effects / particles (unchecked)" in lines
+    assert "Completed: Weather variants (triggered by effect sprites)" in lines
+    assert len(proj.scene.layers[0].time_variants) == 4
+    assert proj.scene.effects == []
+
+
+async def test_generation_log_is_bounded() -> None:
+    """Generation log should cap its line store."""
+    from animeforge.screens.generation import _LOG_MAX_LINES
+
+    app = AnimeForgeApp()
+    async with app.run_test() as pilot:
+        pilot.app.navigate("generation")
+        await pilot.pause()
+
+        log = pilot.app.screen.query_one("#gen-log", RichLog)
+        assert log.max_lines == _LOG_MAX_LINES
+
+
 # ---------------------------------------------------------------------------
 # 7. Export screen
 # ---------------------------------------------------------------------------
@@ -408,6 +598,35 @@ async def test_preview_has_variant_selectors() -> None:
         assert screen.query_one("#btn-refresh-preview", Button) is not None
 
 
+def test_preview_canvas_clips_zone_labels() -> None:
+    """Zone labels are drawn inside the canvas even when the zone hangs off the left edge."""
+    from animeforge.models import Rect, Scene, Zone
+    from animeforge.models.enums import Season, TimeOfDay, Weather
+    from animeforge.screens.preview import _SceneCanvas
+
+    scene = Scene(
+        name="S",
+        zones=[
+            Zone(id="d", name="Desk", bounds=Rect(x=100, y=100, width=600, height=400), z_index=0),
+            Zone(
+                id="w",
+                name="Window",
+                bounds=Rect(x=-80, y=600, width=900, height=300),
+                z_index=0,
+            ),
+        ],
+    )
+    canvas = _SceneCanvas()
+    canvas.set_scene(scene, TimeOfDay.DAY, Weather.CLEAR, Season.SUMMER)
+
+    rows = str(canvas.renderable).splitlines()[1:-1]
+    assert len(rows) == 20
+    assert all(len(row) == 80 for row in rows)
+    assert any("#Desk" in row for row in rows)
+    # The window zone starts off-canvas, so only the tail of its label is visible.
+    assert any(row.startswith("|ndow ") for row in rows)
+
+
 # ---------------------------------------------------------------------------
 # 8. Screen navigation
 # ---------------------------------------------------------------------------
@@ -821,6 +1040,121 @@ async def test_scene_editor_add_zone_appears_in_table() -> None:
         assert "saved" in str(label.renderable).lower()
 
 
+async def test_scene_editor_loads_project_zones_into_table() -> None:
+    """Zones from the current project populate the zone table on mount."""
+    from animeforge.models import Project, Rect, Scene, Zone
+
+    zones = [
+        Zone(id="desk", name="Desk", bounds=Rect(x=10, y=20, width=30, height=40), z_index=2),
+        Zone(
+            id="window",
+            name="Window",
+            bounds=Rect(x=1, y=2, width=3, height=4),
+            z_index=0,
+            character_animations=["idle", "looking_window"],
+            interactive=False,
+        ),
+    ]
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.current_project = Project(name="P", scene=Scene(name="S", zones=zones))
+        pilot.app.navigate("scene_editor")
+        await pilot.pause()
+
+        zone_table = pilot.app.screen.query_one("#zone-table", DataTable)
+        assert zone_table.row_count == 2
+        assert zone_table.get_row_at(0) == [
+            "desk",
+            "Desk",
+            "10.0",
+            "20.0",
+            "30.0",
+            "40.0",
+            "2",
+            "",
+            "Yes",
+        ]
+        assert zone_table.get_row_at(1)[7:] == ["idle, looking_window", "No"]
+
+
+async def test_scene_editor_fills_large_zone_table_in_chunks(tmp_path: Path) -> None:
+    """Large scenes are loaded chunk by chunk and saving waits for the fill to finish."""
+    from animeforge.models import Project, Rect, Scene, Zone
+
+    zones = [
+        Zone(id=f"z{i}", name=f"Zone {i}", bounds=Rect(x=i, y=0, width=1, height=1), z_index=0)
+        for i in range(250)
+    ]
+    proj = Project(name="P", scene=Scene(name="S", zones=zones), project_dir=tmp_path)
+
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.current_project = proj
+        pilot.app.navigate("scene_editor")
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        zone_table = screen.query_one("#zone-table", DataTable)
+        assert zone_table.row_count == 250
+        assert zone_table.get_row_at(249)[0] == "z249"
+
+        screen._save_scene()
+        await pilot.pause()
+
+    assert [z.id for z in proj.scene.zones] == [z.id for z in zones]
+
+
+async def test_scene_editor_syncs_zone_editor_after_chunked_fill() -> None:
+    """A zone added while the table is still filling reaches the ZoneEditor."""
+    from animeforge.models import Rect, Zone
+
+    zones = [
+        Zone(id=f"z{i}", name=f"Zone {i}", bounds=Rect(x=i, y=0, width=1, height=1), z_index=0)
+        for i in range(250)
+    ]
+
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.navigate("scene_editor")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen._set_table_zones(zones)
+        assert screen._zones_loading
+
+        screen.query_one("#zone-id", Input).value = "late"
+        screen.query_one("#zone-name", Input).value = "Late Zone"
+        screen._save_zone_from_fields()
+
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        editor_ids = [z.id for z in screen._zone_editor.zones]
+        assert len(editor_ids) == 251
+        assert "late" in editor_ids
+
+
+async def test_scene_editor_buttons_dispatch_to_handlers() -> None:
+    """Toolbar buttons route to their handlers; Back pops the screen."""
+    from animeforge.screens.dashboard import DashboardScreen
+
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.navigate("scene_editor")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen.query_one("#btn-save-zone", Button).press()
+        await pilot.pause()
+        label = screen.query_one("#scene-status", Label)
+        assert "required" in str(label.renderable).lower()
+
+        screen.query_one("#btn-back", Button).press()
+        await pilot.pause()
+        assert isinstance(pilot.app.screen, DashboardScreen)
+
+
 async def test_scene_editor_add_zone_requires_id_and_name() -> None:
     """Saving with empty Zone ID and Name shows required fields status."""
     app = AnimeForgeApp()
@@ -927,6 +1261,195 @@ async def test_scene_editor_save_scene_updates_project(tmp_path: object) -> None
         assert "saved" in str(label.renderable).lower()
 
 
+async def test_scene_editor_save_scene_keeps_loaded_and_new_zones(tmp_path: Path) -> None:
+    """Saving keeps zones loaded from the project and zones added via the fields."""
+    from animeforge.models import Project, Rect, Scene, Zone
+
+    desk = Zone(
+        id="desk",
+        name="Desk",
+        bounds=Rect(x=10.5, y=20, width=30, height=40),
+        z_index=2,
+        character_animations=["idle", "typing"],
+    )
+    proj = Project(name="P", scene=Scene(name="S", zones=[desk]), project_dir=tmp_path)
+
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.current_project = proj
+        pilot.app.navigate("scene_editor")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen.query_one("#zone-id", Input).value = "window"
+        screen.query_one("#zone-name", Input).value = "Window"
+        screen.query_one("#zone-x", Input).value = "5"
+        screen.query_one("#zone-anims", Input).value = "looking_window, "
+        screen._save_zone_from_fields()
+        screen._save_scene()
+        await pilot.pause()
+
+    assert [z.id for z in proj.scene.zones] == ["desk", "window"]
+    assert proj.scene.zones[0] == desk
+    window = proj.scene.zones[1]
+    assert window.bounds == Rect(x=5, y=0, width=200, height=200)
+    assert window.z_index == 1
+    assert window.character_animations == ["looking_window"]
+
+
+async def test_scene_editor_save_scene_skips_unchanged_scene(tmp_path: Path) -> None:
+    """A second Save Scene with no edits in between does not rewrite the project."""
+    from animeforge.models import Project, Scene
+
+    proj = Project(name="P", scene=Scene(name="S"), project_dir=tmp_path)
+    project_file = tmp_path / "project.json"
+
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.current_project = proj
+        pilot.app.navigate("scene_editor")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        label = screen.query_one("#scene-status", Label)
+        screen._save_scene()
+        assert project_file.exists()
+        project_file.unlink()
+
+        screen._save_scene()
+        assert "no changes" in str(label.renderable).lower()
+        assert not project_file.exists()
+
+        screen.query_one("#scene-name", Input).value = "Renamed"
+        await pilot.pause()
+        screen._save_scene()
+        assert "saved" in str(label.renderable).lower()
+
+    assert Project.load(project_file).scene.name == "Renamed"
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "message"),
+    [
+        ("#zone-x", "abc", "invalid coordinate"),
+        ("#zone-w", "nan", "invalid coordinate"),
+        ("#zone-h", "inf", "invalid coordinate"),
+        ("#zone-z", "1.5", "invalid z-index"),
+    ],
+)
+async def test_scene_editor_save_zone_rejects_bad_zone_numbers(
+    tmp_path: Path, field: str, value: str, message: str
+) -> None:
+    """Non-numeric or non-finite zone fields are rejected before reaching the table."""
+    from animeforge.models import Project, Scene
+
+    proj = Project(name="P", scene=Scene(name="S"), project_dir=tmp_path)
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.current_project = proj
+        pilot.app.navigate("scene_editor")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen.query_one("#zone-id", Input).value = "desk"
+        screen.query_one("#zone-name", Input).value = "Desk"
+        screen.query_one(field, Input).value = value
+        screen._save_zone_from_fields()
+        await pilot.pause()
+
+        label = screen.query_one("#scene-status", Label)
+        assert message in str(label.renderable).lower()
+        assert screen.query_one("#zone-table", DataTable).row_count == 0
+        assert screen.query_one("#zone-id", Input).value == "desk"
+
+
+async def test_scene_editor_import_background_copies_into_project(tmp_path: Path) -> None:
+    """Importing a background copies it into the project and sets the base layer."""
+    from animeforge.models import Layer, Project, Scene
+
+    src = tmp_path / "bg.png"
+    src.write_bytes(b"\x89PNG fake image")
+    project_dir = tmp_path / "proj"
+    proj = Project(
+        name="P",
+        scene=Scene(name="S", layers=[Layer(id="fg", z_index=5), Layer(id="bg", z_index=0)]),
+        project_dir=project_dir,
+    )
+
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.current_project = proj
+        pilot.app.navigate("scene_editor")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen.query_one("#bg-image-path", Input).value = str(src)
+        screen._import_background()
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        label = screen.query_one("#scene-status", Label)
+        assert "background imported: bg.png" in str(label.renderable).lower()
+
+    dest = project_dir / "backgrounds" / "bg.png"
+    assert dest.read_bytes() == src.read_bytes()
+    assert proj.scene.layers[1].image_path == dest
+    assert proj.scene.layers[0].image_path is None
+
+
+async def test_scene_editor_import_background_rejects_directories(tmp_path: Path) -> None:
+    """A directory path is reported as not found instead of being copied."""
+    from animeforge.models import Project, Scene
+
+    proj = Project(name="P", scene=Scene(name="S"), project_dir=tmp_path / "proj")
+
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.current_project = proj
+        pilot.app.navigate("scene_editor")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen.query_one("#bg-image-path", Input).value = str(tmp_path)
+        screen._import_background()
+        await pilot.pause()
+
+        label = screen.query_one("#scene-status", Label)
+        assert "file not found" in str(label.renderable).lower()
+    assert proj.scene.layers == []
+
+
+async def test_scene_editor_generate_background_saves_before_navigating(
+    tmp_path: Path,
+) -> None:
+    """Generate Background saves the staged prompt, then opens the generation screen."""
+    from animeforge.models import Project, Scene
+    from animeforge.screens.generation import GenerationScreen
+
+    proj = Project(name="P", scene=Scene(name="S"), project_dir=tmp_path)
+
+    app = AnimeForgeApp()
+    async with app.run_test(size=(120, 80)) as pilot:
+        pilot.app.current_project = proj
+        pilot.app.navigate("scene_editor")
+        await pilot.pause()
+
+        screen = pilot.app.screen
+        screen.query_one("#scene-name", Input).value = ""
+        screen.query_one("#bg-prompt", Input).value = "rainy cafe at night"
+        screen._generate_background()
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert isinstance(pilot.app.screen, GenerationScreen)
+
+    assert proj.scene.description == "rainy cafe at night"
+    assert proj.scene.name == "rainy cafe at night"
+    saved = Project.load(tmp_path)
+    assert saved.scene.description == "rainy cafe at night"
+    assert saved.scene.name == "rainy cafe at night"
+
+
 async def test_scene_editor_edit_selected_zone() -> None:
     """Clicking Edit Zone populates the zone fields from the selected row."""
     app = AnimeForgeApp()
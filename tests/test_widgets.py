@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 from PIL import Image
@@ -91,6 +92,18 @@ async def test_progress_panel_add_task() -> None:
         assert entry.task_id == "bg"
 
 
+async def test_progress_panel_add_tasks_mounts_in_order() -> None:
+    """add_tasks() mounts every entry, in order, above the overall section."""
+    panel = ProgressPanel()
+    app = _WidgetApp(panel)
+    async with app.run_test() as pilot:
+        pp = pilot.app.query_one(ProgressPanel)
+        pp.add_tasks([("bg", "Background"), ("char", "Characters"), ("fx", "Effects")])
+        await pilot.pause()
+        assert [e.task_id for e in pp.query(_TaskEntry)] == ["bg", "char", "fx"]
+        assert pp.children[-1].has_class("pp-overall")
+
+
 async def test_progress_panel_set_progress() -> None:
     """set_progress() updates the task entry status label."""
     panel = ProgressPanel()
@@ -100,7 +113,7 @@ async def test_progress_panel_set_progress() -> None:
         pp.add_task("bg", "Background")
         await pilot.pause()
         pp.set_progress("bg", 50.0)
-        await pilot.pause()
+        await pilot.pause(0.1)
         entry = pp.query_one("#te-bg", _TaskEntry)
         status = entry.query_one(".te-status", Label)
         assert "50" in str(status.renderable)
@@ -142,6 +155,69 @@ async def test_progress_panel_all_completed_and_reset() -> None:
         assert pp._tasks["bg"][1] == 0.0
         assert pp._tasks["char"][1] == 0.0
 
+        # After a reset, one finished task is no longer "all completed"
+        before = len([m for m in app.captured if isinstance(m, ProgressPanel.AllCompleted)])
+        pp.set_progress("bg", 100.0)
+        await pilot.pause()
+        after = len([m for m in app.captured if isinstance(m, ProgressPanel.AllCompleted)])
+        assert after == before
+
+
+async def test_progress_panel_coalesces_burst_updates() -> None:
+    """A burst of set_progress() calls redraws each task once with the latest value."""
+    panel = ProgressPanel()
+    app = _WidgetApp(panel)
+    async with app.run_test() as pilot:
+        pp = pilot.app.query_one(ProgressPanel)
+        pp.add_task("bg", "Background")
+        await pilot.pause()
+        entry = pp.query_one("#te-bg", _TaskEntry)
+        drawn: list[float] = []
+        original = entry.set_progress
+
+        def _spy(pct: float, status: str = "") -> None:
+            drawn.append(pct)
+            original(pct, status)
+
+        entry.set_progress = _spy  # type: ignore[method-assign]
+        for pct in range(0, 100, 5):
+            pp.set_progress("bg", float(pct))
+        assert pp._tasks["bg"][1] == 95.0
+        await pilot.pause(0.1)
+        assert drawn == [95.0]
+        assert pp.query_one("#pp-overall-bar", ProgressBar).progress == 95.0
+
+
+async def test_progress_panel_clear_tasks_removes_entries() -> None:
+    """clear_tasks() removes every task entry and forgets the tasks."""
+    panel = ProgressPanel()
+    app = _WidgetApp(panel)
+    async with app.run_test() as pilot:
+        pp = pilot.app.query_one(ProgressPanel)
+        pp.add_task("bg", "Background")
+        pp.add_task("char", "Characters")
+        await pilot.pause()
+        pp.clear_tasks()
+        await pilot.pause()
+        assert not pp.query(_TaskEntry)
+        assert pp._tasks == {}
+
+
+async def test_progress_panel_skips_repeated_progress() -> None:
+    """Re-reporting the same percentage without a status does not schedule a redraw."""
+    panel = ProgressPanel()
+    app = _WidgetApp(panel)
+    async with app.run_test() as pilot:
+        pp = pilot.app.query_one(ProgressPanel)
+        pp.add_task("bg", "Background")
+        await pilot.pause()
+        pp.set_progress("bg", 40.0)
+        await pilot.pause(0.1)
+        pp.set_progress("bg", 40.0)
+        assert pp._pending == {}
+        pp.set_progress("bg", 40.0, "Still going")
+        assert pp._pending == {"bg": (40.0, "Still going")}
+
 
 # ===========================================================================
 # ZoneEditor tests
@@ -217,6 +293,94 @@ async def test_zone_editor_delete_zone() -> None:
         assert changed[-1].zones == []
 
 
+async def test_zone_editor_updates_rows_in_place() -> None:
+    """set_zones() keeps existing row keys and only rewrites changed cells."""
+    ze = ZoneEditor()
+    app = _WidgetApp(ze)
+    async with app.run_test() as pilot:
+        editor = pilot.app.query_one(ZoneEditor)
+        editor.set_zones([_make_zone("desk", "Desk"), _make_zone("window", "Window")])
+        await pilot.pause()
+        table = editor.query_one("#ze-table", DataTable)
+        keys = list(table.rows)
+
+        editor.set_zones([_make_zone("desk", "Work Desk"), _make_zone("window", "Window")])
+        await pilot.pause()
+        assert list(table.rows) == keys
+        assert table.get_row(keys[0])[1] == "Work Desk"
+
+        editor.set_zones([_make_zone("desk", "Work Desk")])
+        await pilot.pause()
+        assert list(table.rows) == keys[:1]
+
+
+async def test_zone_editor_update_and_delete_touch_only_their_rows() -> None:
+    """_update_zone() rewrites one row in place; _delete_zone() keeps the other row keys."""
+    ze = ZoneEditor()
+    app = _WidgetApp(ze)
+    async with app.run_test() as pilot:
+        editor = pilot.app.query_one(ZoneEditor)
+        zones = [
+            _make_zone("desk", "Desk"),
+            _make_zone("window", "Window"),
+            _make_zone("bed", "Bed"),
+        ]
+        editor.set_zones(zones)
+        await pilot.pause()
+        table = editor.query_one("#ze-table", DataTable)
+        keys = list(table.rows)
+
+        editor.query_one("#ze-id", Input).value = "window"
+        editor.query_one("#ze-x", Input).value = "42"
+        editor._update_zone()
+        await pilot.pause()
+        assert list(table.rows) == keys
+        assert table.get_row(keys[1])[2] == "42.0"
+
+        table.move_cursor(row=1)
+        editor._delete_zone()
+        await pilot.pause()
+        assert list(table.rows) == [keys[0], keys[2]]
+        assert [z.id for z in editor.zones] == ["desk", "bed"]
+
+
+async def test_zone_editor_update_keeps_unedited_fields() -> None:
+    """_update_zone() changes bounds but keeps the zone's character animations."""
+    ze = ZoneEditor()
+    app = _WidgetApp(ze)
+    async with app.run_test() as pilot:
+        editor = pilot.app.query_one(ZoneEditor)
+        zone = _make_zone("desk", "Desk").model_copy(update={"character_animations": ["typing"]})
+        editor.set_zones([zone])
+        await pilot.pause()
+
+        editor.query_one("#ze-id", Input).value = "desk"
+        editor.query_one("#ze-w", Input).value = "320"
+        editor._update_zone()
+        await pilot.pause()
+
+        (updated,) = editor.zones
+        assert updated.bounds.width == 320.0
+        assert updated.name == "Desk"
+        assert updated.character_animations == ["typing"]
+
+
+async def test_zone_editor_ignores_malformed_numbers() -> None:
+    """_add_zone() leaves the zone list alone when a numeric field does not parse."""
+    ze = ZoneEditor()
+    app = _WidgetApp(ze)
+    async with app.run_test() as pilot:
+        editor = pilot.app.query_one(ZoneEditor)
+        editor.query_one("#ze-id", Input).value = "desk"
+        editor.query_one("#ze-name", Input).value = "Desk"
+        editor.query_one("#ze-w", Input).value = "wide"
+        editor._add_zone()
+        await pilot.pause()
+        assert editor.zones == []
+        assert editor.query_one("#ze-table", DataTable).row_count == 0
+        assert not [m for m in app.captured if isinstance(m, ZoneEditor.Changed)]
+
+
 # ===========================================================================
 # ImagePreview tests
 # ===========================================================================
@@ -250,6 +414,70 @@ async def test_image_preview_load_real_image(tmp_path: Path) -> None:
         assert "64x32" in info_text
 
 
+async def test_image_preview_reload_picks_up_changed_file(tmp_path: Path) -> None:
+    """Re-loading a path after the file changed on disk shows the new dimensions."""
+    img_path = tmp_path / "swap.png"
+    Image.new("RGB", (64, 32)).save(img_path)
+
+    preview = ImagePreview()
+    app = _WidgetApp(preview)
+    async with app.run_test() as pilot:
+        ip = pilot.app.query_one(ImagePreview)
+        ip.load_image(img_path)
+        await pilot.pause()
+        assert "64x32" in str(ip.query_one("#ip-info", Label).renderable)
+
+        Image.new("RGB", (300, 200), color=(0, 255, 0)).save(img_path)
+        ip.load_image(img_path)
+        await pilot.pause()
+        assert "300x200" in str(ip.query_one("#ip-info", Label).renderable)
+
+
+async def test_image_preview_skips_identical_reload(tmp_path: Path) -> None:
+    """Re-loading an unchanged file leaves the widgets alone; clear() resets that."""
+    img_path = tmp_path / "same.png"
+    Image.new("RGB", (64, 32)).save(img_path)
+
+    preview = ImagePreview()
+    app = _WidgetApp(preview)
+    async with app.run_test() as pilot:
+        ip = pilot.app.query_one(ImagePreview)
+        info = ip.query_one("#ip-info", Label)
+        ip.load_image(img_path)
+        info.update("sentinel")
+        ip.load_image(img_path)
+        await pilot.pause()
+        assert str(info.renderable) == "sentinel"
+
+        ip.clear()
+        ip.load_image(img_path)
+        await pilot.pause()
+        assert "64x32" in str(info.renderable)
+
+
+def test_image_dimensions_from_headers_and_pil_fallback(tmp_path: Path) -> None:
+    """PNG/JPEG sizes come from the header; other formats fall back to PIL."""
+    from animeforge.widgets.image_preview import _header_dimensions, _image_dimensions
+
+    for name, fmt in (("a.png", "PNG"), ("a.jpg", "JPEG"), ("a.gif", "GIF")):
+        path = tmp_path / name
+        Image.new("RGB", (321, 123)).save(path, fmt)
+        with path.open("rb") as fp:
+            header = _header_dimensions(fp)
+        assert header == (None if fmt == "GIF" else (321, 123))
+        assert _image_dimensions(path, 0, 0) == (321, 123)
+
+
+def test_header_dimensions_rejects_jpeg_segment_without_marker_prefix() -> None:
+    """A JPEG walk that lands on non-marker bytes gives up instead of guessing."""
+    from animeforge.widgets.image_preview import _header_dimensions
+
+    # SOI, an APP0 segment, then junk where the next 0xFF marker should be:
+    # 0xC0 would otherwise be read as SOF0 with a bogus size.
+    data = b"\xff\xd8" + b"\xff\xe0\x00\x04\x00\x00" + b"\xc0\x00\x11\x08\x00\x10\x00\x20"
+    assert _header_dimensions(io.BytesIO(data)) is None
+
+
 async def test_image_preview_missing_file_error() -> None:
     """Loading a nonexistent file shows 'File not found'."""
     preview = ImagePreview()
@@ -338,3 +566,63 @@ async def test_state_graph_set_data_renders_nodes() -> None:
         legend = graph.query_one("#sg-legend", Static)
         legend_text = str(legend.renderable)
         assert "Transitions:" in legend_text
+
+
+async def test_state_graph_skips_unchanged_render() -> None:
+    """set_data() with identical content does not rebuild the canvas."""
+    anims = [_make_anim("idle", "Idle"), _make_anim("typing", "Typing")]
+    trans = [_make_transition("idle", "typing")]
+
+    app = _WidgetApp(StateGraph())
+    async with app.run_test() as pilot:
+        graph = pilot.app.query_one(StateGraph)
+        canvas = graph.query_one("#sg-canvas", Static)
+        updates: list[object] = []
+        original_update = canvas.update
+
+        def _spy(renderable: object = "") -> None:
+            updates.append(renderable)
+            original_update(renderable)  # type: ignore[arg-type]
+
+        canvas.update = _spy  # type: ignore[method-assign]
+        graph.set_data(anims, trans)
+        graph.set_data(list(anims), list(trans))
+        assert len(updates) == 1
+
+        graph.set_data(anims, [_make_transition("typing", "idle")])
+        assert len(updates) == 2
+
+
+async def test_state_graph_skips_identical_legend_write() -> None:
+    """Renaming a state redraws the canvas but leaves an unchanged legend alone."""
+    trans = [_make_transition("idle", "typing")]
+
+    app = _WidgetApp(StateGraph())
+    async with app.run_test() as pilot:
+        graph = pilot.app.query_one(StateGraph)
+        graph.set_data([_make_anim("idle", "Idle"), _make_anim("typing", "Typing")], trans)
+        legend = graph.query_one("#sg-legend", Static)
+        writes: list[object] = []
+        original_update = legend.update
+
+        def _spy(renderable: object = "") -> None:
+            writes.append(renderable)
+            original_update(renderable)  # type: ignore[arg-type]
+
+        legend.update = _spy  # type: ignore[method-assign]
+        graph.set_data([_make_anim("idle", "Resting"), _make_anim("typing", "Typing")], trans)
+        assert "Resting" in str(graph.query_one("#sg-canvas", Static).renderable)
+        assert writes == []
+
+
+async def test_state_graph_draws_reciprocal_edges_once() -> None:
+    """A<->B transitions share one plain span with an arrow head at each end."""
+    anims = [_make_anim("idle", "Idle"), _make_anim("typing", "Typing")]
+    trans = [_make_transition("idle", "typing"), _make_transition("typing", "idle")]
+
+    app = _WidgetApp(StateGraph())
+    async with app.run_test() as pilot:
+        graph = pilot.app.query_one(StateGraph)
+        graph.set_data(anims, trans)
+        edge_row = str(graph.query_one("#sg-canvas", Static).renderable).splitlines()[4]
+        assert edge_row.strip() == "<" + "-" * 19 + ">"
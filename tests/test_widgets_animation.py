@@ -139,6 +139,25 @@ class TestAnimationPickerSetAnimations:
             row = table.get_row_at(0)
             assert str(row[0]) == "c"
 
+    async def test_set_animations_updates_rows_in_place(self) -> None:
+        app = AnimationPickerApp(animations=[_make_anim("a"), _make_anim("b"), _make_anim("c")])
+        async with app.run_test():
+            picker = app.query_one(AnimationPicker)
+            table = app.query_one("#ap-custom-table", DataTable)
+            key_a = table.coordinate_to_cell_key((0, 0)).row_key
+            picker.set_animations([_make_anim("a"), _make_anim("c", fps=24), _make_anim("d")])
+            assert [str(table.get_row_at(i)[0]) for i in range(table.row_count)] == ["a", "c", "d"]
+            assert table.coordinate_to_cell_key((0, 0)).row_key == key_a
+            assert str(table.get_row_at(1)[3]) == "24"
+
+    async def test_set_animations_reorder_rebuilds(self) -> None:
+        app = AnimationPickerApp(animations=[_make_anim("a"), _make_anim("b")])
+        async with app.run_test():
+            picker = app.query_one(AnimationPicker)
+            picker.set_animations([_make_anim("b"), _make_anim("a")])
+            table = app.query_one("#ap-custom-table", DataTable)
+            assert [str(table.get_row_at(i)[0]) for i in range(table.row_count)] == ["b", "a"]
+
     async def test_set_animations_to_empty(self) -> None:
         app = AnimationPickerApp(animations=[_make_anim("x")])
         async with app.run_test():